@@ -0,0 +1,5 @@
+import os
+
+ADMIN_APPROXIMATE_COUNT_THRESHOLD = int(
+    os.environ.get("ADMIN_APPROXIMATE_COUNT_THRESHOLD", 100000)
+)
@@ -0,0 +1,12 @@
+import os
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+    }
+}
+
+MOVIES_API_CACHE_TIMEOUT = int(os.environ.get("MOVIES_API_CACHE_TIMEOUT", 300))
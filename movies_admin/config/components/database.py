@@ -9,5 +9,21 @@ DATABASES = {
         "HOST": os.environ.get("DB_HOST", "127.0.0.1"),
         "PORT": os.environ.get("DB_PORT", 5433),
         "OPTIONS": {"options": "-c search_path=content,public"},
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": (
+            os.environ.get("DB_CONN_HEALTH_CHECKS") == "True"
+        ),
+        "DISABLE_SERVER_SIDE_CURSORS": (
+            os.environ.get("DB_DISABLE_SERVER_SIDE_CURSORS") == "True"
+        ),
     }
 }
+
+# Exports stream through a named cursor that never outlives its transaction,
+# which works behind a transaction pooler too, so they keep server-side
+# cursors even when the default connection disables them.
+DATABASES["export"] = {
+    **DATABASES["default"],
+    "DISABLE_SERVER_SIDE_CURSORS": False,
+    "TEST": {"MIRROR": "default"},
+}
@@ -0,0 +1,27 @@
+import os
+
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", False) == "True"
+PROFILING_PATH_PREFIXES = os.environ.get(
+    "PROFILING_PATH_PREFIXES", "/admin/"
+).split(", ")
+
+ADMIN_QUERY_BUDGETS = {
+    "movies.filmwork": {"changelist": 8, "change": 25},
+    "movies.person": {"changelist": 6, "change": 30},
+    "movies.genre": {"changelist": 6, "change": 8},
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "movies.profiling": {
+            "handlers": ["console"],
+            "level": os.environ.get("PROFILING_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
+}
@@ -21,6 +21,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'movies.apps.MoviesConfig',
 ]
 
@@ -56,6 +57,9 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 include(
     'components/database.py',
+    'components/admin.py',
+    'components/cache.py',
+    'components/profiling.py',
 )
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -87,6 +91,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 LOCALE_PATHS = ['movies/locale']
 
+if PROFILING_ENABLED:  # noqa: F821
+    MIDDLEWARE.insert(0, 'movies.profiling.QueryProfilingMiddleware')
+
 if DEBUG:
     INTERNAL_IPS = os.environ.get('INTERNAL_IPS').split(', ')
     MIDDLEWARE += ['debug_toolbar.middleware.DebugToolbarMiddleware']
@@ -1,35 +1,126 @@
 from django.contrib import admin
+from django.db.models import Prefetch
+from django.utils.translation import gettext_lazy as _
+
+from .changelist import KeysetPaginationMixin
+from .exports import ExportActionsMixin
+from .forms import PaginatedInlineFormSet
 from .models import Genre, Filmwork, GenreFilmwork, Person, PersonFilmwork
+from .paginator import ApproximateCountPaginator
+from .search import FullTextSearchMixin
+
+
+class PaginatedInlineMixin:
+    formset = PaginatedInlineFormSet
+    template = 'admin/movies/edit_inline/paginated_tabular.html'
+    per_page = 20
+    extra = 1
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        page_param = f'{formset.get_default_prefix()}-page'
+        return type(formset.__name__, (formset,), {
+            'per_page': self.per_page,
+            'page_number': request.GET.get(page_param, 1),
+            'page_param': page_param,
+            'query_params': request.GET,
+        })
 
 
-class GenreFilmworkInline(admin.TabularInline):
+class GenreFilmworkInline(PaginatedInlineMixin, admin.TabularInline):
     model = GenreFilmwork
+    autocomplete_fields = ('genre',)
 
 
-class PersonFilmworkInline(admin.TabularInline):
+class PersonFilmworkInline(PaginatedInlineMixin, admin.TabularInline):
     model = PersonFilmwork
+    autocomplete_fields = ('film_work', 'person',)
 
 
 @admin.register(Genre)
-class GenreAdmin(admin.ModelAdmin):
+class GenreAdmin(FullTextSearchMixin, admin.ModelAdmin):
     search_fields = ('name', 'description', 'id',)
+    search_vector_fields = ('name', 'description',)
+
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Filmwork)
-class FilmworkAdmin(admin.ModelAdmin):
-    inlines = (GenreFilmworkInline,)
+class FilmworkAdmin(ExportActionsMixin, KeysetPaginationMixin,
+                    FullTextSearchMixin, admin.ModelAdmin):
+    inlines = (GenreFilmworkInline, PersonFilmworkInline,)
 
-    list_display = ('title', 'type', 'created_at', 'rating',)
+    list_display = ('title', 'type', 'get_genres', 'get_actors',
+                    'get_directors', 'get_writers', 'created_at', 'rating',)
 
     list_filter = ('type',)
 
     search_fields = ('title', 'description', 'id',)
+    search_vector_fields = ('title', 'description',)
+    trigram_search_fields = ('title',)
+
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+    keyset_fields = ('created_at', 'title',)
+    export_name = 'film_works'
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # The name columns are only rendered by the change list; the change
+        # form, delete page and autocomplete would fetch the prefetches for
+        # nothing.
+        opts = self.model._meta
+        url_name = f'{opts.app_label}_{opts.model_name}_changelist'
+        if request.resolver_match.url_name != url_name:
+            return queryset
+        return queryset.prefetch_related(
+            Prefetch('genres', queryset=Genre.objects.only('id', 'name')),
+            Prefetch(
+                'personfilmwork_set',
+                queryset=PersonFilmwork.objects.select_related('person').only(
+                    'film_work', 'person', 'role', 'person__full_name'
+                ),
+            ),
+        )
+
+    @staticmethod
+    def _get_person_names(obj, role):
+        return ', '.join(
+            person_film_work.person.full_name
+            for person_film_work in obj.personfilmwork_set.all()
+            if person_film_work.role == role
+        )
+
+    @admin.display(description=_('genres'))
+    def get_genres(self, obj):
+        return ', '.join(genre.name for genre in obj.genres.all())
+
+    @admin.display(description=_('actors'))
+    def get_actors(self, obj):
+        return self._get_person_names(obj, PersonFilmwork.Role.ACTOR)
+
+    @admin.display(description=_('directors'))
+    def get_directors(self, obj):
+        return self._get_person_names(obj, PersonFilmwork.Role.DIRECTOR)
+
+    @admin.display(description=_('writers'))
+    def get_writers(self, obj):
+        return self._get_person_names(obj, PersonFilmwork.Role.WRITER)
 
 
 @admin.register(Person)
-class PersonAdmin(admin.ModelAdmin):
+class PersonAdmin(ExportActionsMixin, KeysetPaginationMixin,
+                  FullTextSearchMixin, admin.ModelAdmin):
     inlines = (PersonFilmworkInline,)
 
     list_display = ('full_name', 'created_at',)
 
     search_fields = ('full_name', 'id',)
+    search_vector_fields = ('full_name',)
+    trigram_search_fields = ('full_name',)
+
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+    keyset_fields = ('created_at', 'full_name',)
+    export_name = 'persons'
@@ -0,0 +1,68 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.generic.detail import BaseDetailView
+from django.views.generic.list import BaseListView
+
+from movies.cache import get_catalog_cache_key
+from movies.models import FilmworkDocument
+
+
+class MoviesApiMixin:
+    model = FilmworkDocument
+    http_method_names = ['get']
+
+    def get_queryset(self):
+        return FilmworkDocument.objects.order_by(
+            '-film_work__created_at', '-film_work_id'
+        ).values_list('document', flat=True)
+
+    def get_cache_key(self):
+        # Only the path and the page number select a response, so other query
+        # parameters cannot fill the cache with copies of it.
+        return get_catalog_cache_key(
+            self.request.path, self.request.GET.get('page', 1)
+        )
+
+    def get(self, request, *args, **kwargs):
+        cache_key = self.get_cache_key()
+        cached = cache.get(cache_key)
+        if cached is None:
+            body = super().get(request, *args, **kwargs).content
+            cached = (quote_etag(hashlib.md5(body).hexdigest()), body)
+            cache.set(cache_key, cached, settings.MOVIES_API_CACHE_TIMEOUT)
+
+        etag, body = cached
+        response = HttpResponse(body, content_type='application/json')
+        response.headers['ETag'] = etag
+        return get_conditional_response(request, etag=etag, response=response)
+
+    def render_to_response(self, context, **response_kwargs):
+        return JsonResponse(context, **response_kwargs)
+
+
+class MoviesListApi(MoviesApiMixin, BaseListView):
+    paginate_by = 50
+
+    def get_context_data(self, *, object_list=None, **kwargs):
+        paginator, page, queryset, is_paginated = self.paginate_queryset(
+            self.object_list, self.paginate_by
+        )
+        return {
+            'count': paginator.count,
+            'total_pages': paginator.num_pages,
+            'prev': (
+                page.previous_page_number() if page.has_previous() else None
+            ),
+            'next': page.next_page_number() if page.has_next() else None,
+            'results': list(queryset),
+        }
+
+
+class MoviesDetailApi(MoviesApiMixin, BaseDetailView):
+    def get_context_data(self, **kwargs):
+        return self.object
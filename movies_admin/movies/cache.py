@@ -0,0 +1,21 @@
+import uuid
+
+from django.core.cache import cache
+
+CATALOG_VERSION_KEY = 'movies:catalog:version'
+
+
+def get_catalog_version():
+    return cache.get_or_set(
+        CATALOG_VERSION_KEY, lambda: uuid.uuid4().hex, timeout=None
+    )
+
+
+def bump_catalog_version():
+    cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def get_catalog_cache_key(*parts):
+    return ':'.join(
+        ('movies', 'catalog', get_catalog_version(), *map(str, parts))
+    )
@@ -0,0 +1,126 @@
+import base64
+import binascii
+import json
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import ValidationError
+
+AFTER_VAR = 'after'
+BEFORE_VAR = 'before'
+CURSOR_VARS = (AFTER_VAR, BEFORE_VAR)
+
+
+def encode_cursor(obj, field):
+    values = [field.value_to_string(obj), str(obj.pk)]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, field, pk_field):
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return field.to_python(value), pk_field.to_python(pk)
+    except (binascii.Error, ValueError, TypeError, ValidationError) as e:
+        raise IncorrectLookupParameters(e) from e
+
+
+class KeysetChangeList(ChangeList):
+    def __init__(self, request, *args, **kwargs):
+        self.cursor_var = next(
+            (var for var in CURSOR_VARS if request.GET.get(var)), None
+        )
+        self.cursor = request.GET.get(self.cursor_var)
+        self.keyset_ordering = None
+        super().__init__(request, *args, **kwargs)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        for var in CURSOR_VARS:
+            lookup_params.pop(var, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        remove = [*(remove or []), *CURSOR_VARS]
+        return super().get_query_string(new_params, remove)
+
+    def _get_default_ordering(self):
+        if self.query:
+            return super()._get_default_ordering()
+        return self.model_admin.keyset_default_ordering
+
+    def get_ordering(self, request, queryset):
+        ordering = super().get_ordering(request, queryset)
+        keyset_ordering = self.get_keyset_ordering(ordering)
+        return keyset_ordering or ordering
+
+    def get_keyset_ordering(self, ordering):
+        if len(ordering) != 2:
+            return None
+        if not all(isinstance(part, str) for part in ordering):
+            return None
+        field_name, pk_name = (part.lstrip('-') for part in ordering)
+        if field_name not in self.model_admin.keyset_fields:
+            return None
+        if pk_name not in ('pk', self.lookup_opts.pk.name):
+            return None
+        prefix = '-' if ordering[0].startswith('-') else ''
+        return [f'{prefix}{field_name}', f'{prefix}pk']
+
+    def get_results(self, request):
+        self.keyset_ordering = self.get_keyset_ordering(
+            self.queryset.query.order_by
+        )
+        if self.keyset_ordering is not None:
+            self.page_num = 1
+        super().get_results(request)
+        if self.show_all and self.can_show_all:
+            self.keyset_ordering = None
+        if self.keyset_ordering is None:
+            return
+
+        field_name = self.keyset_ordering[0].lstrip('-')
+        field = self.lookup_opts.get_field(field_name)
+        backwards = self.cursor_var == BEFORE_VAR
+        queryset = self.queryset.reverse() if backwards else self.queryset
+
+        if self.cursor:
+            value, pk = decode_cursor(self.cursor, field, self.lookup_opts.pk)
+            descending = self.keyset_ordering[0].startswith('-')
+            if descending != backwards:
+                seek_lookup, tie_lookup = 'lte', 'gte'
+            else:
+                seek_lookup, tie_lookup = 'gte', 'lte'
+            queryset = queryset.filter(
+                **{f'{field_name}__{seek_lookup}': value}
+            ).exclude(**{field_name: value, f'pk__{tie_lookup}': pk})
+
+        rows = list(queryset[:self.list_per_page + 1])
+        has_more = len(rows) > self.list_per_page
+        rows = rows[:self.list_per_page]
+        if backwards:
+            rows.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous = self.cursor is not None
+            self.has_next = has_more
+
+        self.first_url = self.get_query_string()
+        self.previous_url = self.next_url = None
+        if self.has_previous and rows:
+            self.previous_url = self.get_query_string(
+                {BEFORE_VAR: encode_cursor(rows[0], field)}
+            )
+        if self.has_next and rows:
+            self.next_url = self.get_query_string(
+                {AFTER_VAR: encode_cursor(rows[-1], field)}
+            )
+        self.result_list = rows
+        self.multi_page = self.has_previous or self.has_next
+
+
+class KeysetPaginationMixin:
+    keyset_fields = ('created_at',)
+    keyset_default_ordering = ('-created_at',)
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
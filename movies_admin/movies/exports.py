@@ -0,0 +1,139 @@
+import csv
+import json
+
+from django.contrib import admin
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import OuterRef
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .models import FilmworkDocument, Person, PersonFilmwork
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_DATABASE = 'export'
+
+FILM_WORK_COLUMNS = ('id', 'title', 'description', 'creation_date', 'rating',
+                     'type', 'genres', 'actors', 'directors', 'writers',)
+PERSON_COLUMNS = ('id', 'full_name', 'actor_films', 'director_films',
+                  'writer_films',)
+
+
+def get_film_work_rows(queryset=None):
+    documents = FilmworkDocument.objects.order_by('film_work_id')
+    if queryset is not None:
+        documents = documents.filter(film_work__in=queryset.values('pk'))
+    return documents.values_list('document', flat=True)
+
+
+def get_person_rows(queryset=None):
+    if queryset is None:
+        queryset = Person.objects.all()
+    return queryset.prefetch_related(None).order_by('pk').annotate(**{
+        f'{role}_films': ArraySubquery(
+            PersonFilmwork.objects.filter(
+                person=OuterRef('pk'), role=role
+            ).order_by('film_work__title').values('film_work__title')
+        )
+        for role in PersonFilmwork.Role
+    }).values(*PERSON_COLUMNS)
+
+
+EXPORTS = {
+    'film_works': (FILM_WORK_COLUMNS, get_film_work_rows),
+    'persons': (PERSON_COLUMNS, get_person_rows),
+}
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def format_csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ', '.join(map(str, value))
+    return value
+
+
+def render_csv(rows, columns):
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(
+            [format_csv_value(row.get(column)) for column in columns]
+        )
+
+
+def render_ndjson(rows, columns):
+    for row in rows:
+        yield json.dumps(
+            {column: row.get(column) for column in columns},
+            cls=DjangoJSONEncoder,
+            ensure_ascii=False,
+        ) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', render_csv),
+    'ndjson': ('application/x-ndjson', render_ndjson),
+}
+
+
+def iter_export(queryset, columns, export_format):
+    render = EXPORT_FORMATS[export_format][1]
+    # Outside a transaction Django declares the named cursor WITH HOLD,
+    # which makes PostgreSQL materialize the whole result before the first
+    # row is fetched.
+    with transaction.atomic(using=EXPORT_DATABASE):
+        rows = queryset.using(EXPORT_DATABASE).iterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        )
+        lines = []
+        for line in render(rows, columns):
+            lines.append(line)
+            if len(lines) == EXPORT_CHUNK_SIZE:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+
+
+def get_export_response(queryset, columns, export_format, name):
+    content_type = EXPORT_FORMATS[export_format][0]
+    filename = f'{name}_{timezone.now():%Y%m%d_%H%M%S}.{export_format}'
+    response = StreamingHttpResponse(
+        iter_export(queryset, columns, export_format),
+        content_type=f'{content_type}; charset=utf-8',
+    )
+    response.headers['Content-Disposition'] = (
+        f'attachment; filename="{filename}"'
+    )
+    return response
+
+
+class ExportActionsMixin:
+    export_name = None
+    actions = ('export_csv', 'export_ndjson',)
+
+    def export(self, queryset, export_format):
+        columns, get_rows = EXPORTS[self.export_name]
+        return get_export_response(
+            get_rows(queryset), columns, export_format, self.export_name
+        )
+
+    @admin.action(
+        description=_('Export selected %(verbose_name_plural)s to CSV')
+    )
+    def export_csv(self, request, queryset):
+        return self.export(queryset, 'csv')
+
+    @admin.action(
+        description=_('Export selected %(verbose_name_plural)s to NDJSON')
+    )
+    def export_ndjson(self, request, queryset):
+        return self.export(queryset, 'ndjson')
@@ -0,0 +1,40 @@
+from django.core.paginator import Paginator
+from django.forms.models import BaseInlineFormSet
+from django.http import QueryDict
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    per_page = 20
+    page_number = 1
+    page_param = 'page'
+    query_params = None
+
+    def get_queryset(self):
+        if not hasattr(self, '_page'):
+            paginator = Paginator(super().get_queryset(), self.per_page)
+            self._page = paginator.get_page(self.page_number)
+            self.page_range = paginator.get_elided_page_range(
+                self._page.number, on_each_side=2, on_ends=1
+            )
+        return self._page.object_list
+
+    @property
+    def page(self):
+        self.get_queryset()
+        return self._page
+
+    def page_url(self, number):
+        # Other inlines' pages, the changelist filters and the popup flags
+        # ride along in the query string and must survive the page switch.
+        query_params = QueryDict(mutable=True)
+        if self.query_params is not None:
+            query_params = self.query_params.copy()
+        query_params[self.page_param] = number
+        return f'?{query_params.urlencode()}'
+
+    @property
+    def page_links(self):
+        self.get_queryset()
+        return [
+            (number, self.page_url(number)) for number in self.page_range
+        ]
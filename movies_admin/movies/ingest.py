@@ -0,0 +1,267 @@
+import csv
+import io
+import json
+import sqlite3
+import uuid
+from collections import Counter
+from contextlib import closing
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .cache import bump_catalog_version
+from .exports import FILM_WORK_COLUMNS
+from .models import (Filmwork, FilmworkDocument, Genre, GenreFilmwork, Person,
+                     PersonFilmwork)
+
+INGEST_BATCH_SIZE = 5000
+
+ROLE_COLUMNS = {f'{role}s': role for role in PersonFilmwork.Role}
+LIST_COLUMNS = ('genres', *ROLE_COLUMNS)
+GENRE_FILM_WORK_COLUMNS = ('id', 'film_work_id', 'genre_id', 'created_at',)
+PERSON_FILM_WORK_COLUMNS = ('id', 'film_work_id', 'person_id', 'role',
+                            'created_at',)
+
+COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r',
+})
+
+
+def iter_batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def build_instance(model, values):
+    kwargs = {}
+    for field in model._meta.concrete_fields:
+        if field.attname not in values:
+            continue
+        value = values[field.attname]
+        if value is None and not field.null:
+            if field.has_default():
+                value = field.get_default()
+            elif field.empty_strings_allowed:
+                value = ''
+        kwargs[field.attname] = field.clean(value, None)
+    return model(**kwargs)
+
+
+def format_copy_value(value):
+    if value is None:
+        return '\\N'
+    return str(value).translate(COPY_ESCAPES)
+
+
+def read_ndjson(path):
+    with open(path, encoding='utf-8') as source:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8', newline='') as source:
+        for row in csv.DictReader(source):
+            record = {
+                column: value or None for column, value in row.items()
+                if column in FILM_WORK_COLUMNS
+            }
+            for column in LIST_COLUMNS:
+                value = record.get(column)
+                record[column] = value.split(', ') if value else []
+            yield record
+
+
+class CatalogIngestor:
+    def __init__(self, batch_size=INGEST_BATCH_SIZE, on_skip=None):
+        self.batch_size = batch_size
+        self.on_skip = on_skip or (lambda record, error: None)
+        self.genre_ids = dict(Genre.objects.values_list('name', 'id'))
+        self.person_ids = dict(Person.objects.values_list('full_name', 'id'))
+        self.new_genres = []
+        self.new_persons = []
+        self.counts = Counter()
+
+    def get_genre_id(self, name):
+        if name not in self.genre_ids:
+            genre = build_instance(Genre, {'name': name})
+            self.genre_ids[name] = genre.id
+            self.new_genres.append(genre)
+        return self.genre_ids[name]
+
+    def get_person_id(self, full_name):
+        if full_name not in self.person_ids:
+            person = build_instance(Person, {'full_name': full_name})
+            self.person_ids[full_name] = person.id
+            self.new_persons.append(person)
+        return self.person_ids[full_name]
+
+    def write(self, model, objs):
+        # Conflicting rows are skipped by the database without being
+        # reported back, so the counts are rows sent, not rows inserted.
+        model.objects.bulk_create(
+            objs, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        self.counts[model._meta.model_name] += len(objs)
+
+    def flush_references(self):
+        self.write(Genre, self.new_genres)
+        self.write(Person, self.new_persons)
+        self.new_genres, self.new_persons = [], []
+
+    def copy(self, model, columns, rows):
+        # COPY cannot skip conflicting rows, so the rows go through a
+        # staging table and reach the model table with ON CONFLICT.
+        # Must be called inside a transaction.
+        table = connection.ops.quote_name(model._meta.db_table)
+        column_names = ', '.join(columns)
+        buffer = io.StringIO(
+            ''.join(
+                '\t'.join(map(format_copy_value, row)) + '\n' for row in rows
+            )
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE IF EXISTS pg_temp.ingest_staging')
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE ingest_staging (LIKE {table}) '
+                f'ON COMMIT DROP'
+            )
+            cursor.copy_expert(
+                f'COPY ingest_staging ({column_names}) FROM STDIN', buffer
+            )
+            cursor.execute(
+                f'INSERT INTO {table} ({column_names}) '
+                f'SELECT {column_names} FROM ingest_staging '
+                f'ON CONFLICT DO NOTHING'
+            )
+        self.counts[model._meta.model_name] += len(rows)
+
+    def copy_instances(self, model, objs):
+        # Unlike bulk_create, COPY does not run pre_save, so the source
+        # timestamps survive instead of being replaced by auto_now(_add).
+        now = timezone.now()
+        fields = model._meta.concrete_fields
+        rows = []
+        for obj in objs:
+            row = []
+            for field in fields:
+                value = getattr(obj, field.attname)
+                if value is None and (getattr(field, 'auto_now', False) or
+                                      getattr(field, 'auto_now_add', False)):
+                    value = now
+                row.append(value)
+            rows.append(row)
+        self.copy(model, [field.column for field in fields], rows)
+
+    def ingest_records(self, records):
+        for batch in iter_batches(records, self.batch_size):
+            created_at = timezone.now()
+            film_works, genre_film_works, person_film_works = [], [], []
+            for record in batch:
+                try:
+                    film_work = build_instance(Filmwork, record)
+                    genre_ids = {
+                        self.get_genre_id(name)
+                        for name in record.get('genres') or ()
+                    }
+                    person_roles = {
+                        (self.get_person_id(full_name), role)
+                        for column, role in ROLE_COLUMNS.items()
+                        for full_name in record.get(column) or ()
+                    }
+                except ValidationError as e:
+                    self.counts['skipped'] += 1
+                    self.on_skip(record, e)
+                    continue
+                film_works.append(film_work)
+                genre_film_works.extend(
+                    (uuid.uuid4(), film_work.id, genre_id, created_at)
+                    for genre_id in genre_ids
+                )
+                person_film_works.extend(
+                    (uuid.uuid4(), film_work.id, person_id, role, created_at)
+                    for person_id, role in person_roles
+                )
+            with transaction.atomic():
+                self.flush_references()
+                self.write(Filmwork, film_works)
+                self.copy(GenreFilmwork, GENRE_FILM_WORK_COLUMNS,
+                          genre_film_works)
+                self.copy(PersonFilmwork, PERSON_FILM_WORK_COLUMNS,
+                          person_film_works)
+                FilmworkDocument.objects.refresh(
+                    [film_work.id for film_work in film_works]
+                )
+        bump_catalog_version()
+
+    def ingest_sqlite(self, path):
+        # The SQLite catalog carries its own ids, so genres and persons keep
+        # them rather than being matched by name, and every row keeps its
+        # source timestamps.
+        with closing(sqlite3.connect(path)) as sqlite_conn, \
+                transaction.atomic():
+            sqlite_conn.row_factory = sqlite3.Row
+            genre_ids = self.copy_sqlite_table(sqlite_conn, Genre, 'genre')
+            person_ids = self.copy_sqlite_table(sqlite_conn, Person, 'person')
+            film_work_ids = self.copy_sqlite_table(
+                sqlite_conn, Filmwork, 'film_work'
+            )
+
+            created_at = timezone.now()
+            self.copy_sqlite_links(
+                sqlite_conn, GenreFilmwork, 'genre_film_work',
+                GENRE_FILM_WORK_COLUMNS, created_at,
+                {'film_work_id': film_work_ids, 'genre_id': genre_ids},
+            )
+            self.copy_sqlite_links(
+                sqlite_conn, PersonFilmwork, 'person_film_work',
+                PERSON_FILM_WORK_COLUMNS, created_at,
+                {'film_work_id': film_work_ids, 'person_id': person_ids,
+                 'role': set(PersonFilmwork.Role.values)},
+            )
+            FilmworkDocument.objects.refresh()
+        bump_catalog_version()
+
+    def copy_sqlite_table(self, sqlite_conn, model, table):
+        ids = set()
+        for rows in self.iter_sqlite_batches(sqlite_conn, table):
+            objs = []
+            for row in rows:
+                try:
+                    objs.append(build_instance(model, dict(row)))
+                except ValidationError as e:
+                    self.counts['skipped'] += 1
+                    self.on_skip(dict(row), e)
+            ids.update(str(obj.id) for obj in objs)
+            self.copy_instances(model, objs)
+        return ids
+
+    def copy_sqlite_links(self, sqlite_conn, model, table, columns,
+                          created_at, references):
+        for rows in self.iter_sqlite_batches(sqlite_conn, table):
+            values = []
+            for row in rows:
+                errors = [
+                    f'{column} {row[column]!r} is unknown.'
+                    for column, known in references.items()
+                    if row[column] not in known
+                ]
+                if errors:
+                    self.counts['skipped'] += 1
+                    self.on_skip(dict(row), ValidationError(errors))
+                    continue
+                values.append([
+                    (row[column] or created_at) if column == 'created_at'
+                    else row[column]
+                    for column in columns
+                ])
+            self.copy(model, columns, values)
+
+    def iter_sqlite_batches(self, sqlite_conn, table):
+        cursor = sqlite_conn.execute(f'SELECT * FROM {table}')
+        while rows := cursor.fetchmany(self.batch_size):
+            yield rows
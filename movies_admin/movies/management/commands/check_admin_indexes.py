@@ -0,0 +1,122 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from movies.models import Filmwork, GenreFilmwork, Person, PersonFilmwork
+
+CHANGE_LIST_LIMIT = 101
+
+
+def get_leading_column_indexes(table, column):
+    # Foreign key indexes get hashed names from Django and other names in the
+    # hand-written DDL, so they are found by their first column instead.
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    return {
+        name for name, constraint in constraints.items()
+        if constraint['columns'][:1] == [column]
+        and not constraint['foreign_key']
+    }
+
+
+def get_admin_queries():
+    film_work_ids = list(
+        Filmwork.objects.values_list('pk', flat=True)[:CHANGE_LIST_LIMIT]
+    )
+    film_type = Filmwork.objects.values_list('type', flat=True).first()
+    person_id = Person.objects.values_list('pk', flat=True).first()
+    genre_id = GenreFilmwork.objects.values_list('genre_id', flat=True).first()
+    return {
+        'film works by created_at': (
+            Filmwork.objects.order_by('-created_at', '-pk')[
+                :CHANGE_LIST_LIMIT
+            ],
+            {'film_work_created_at_id_idx'},
+        ),
+        'film works by title': (
+            Filmwork.objects.order_by('title', 'pk')[:CHANGE_LIST_LIMIT],
+            {'film_work_title_id_idx'},
+        ),
+        'film works by rating': (
+            Filmwork.objects.order_by('-rating', '-pk')[:CHANGE_LIST_LIMIT],
+            {'film_work_rating_id_idx'},
+        ),
+        'film works filtered by type': (
+            Filmwork.objects.filter(type=film_type).order_by(
+                '-created_at', '-pk'
+            )[:CHANGE_LIST_LIMIT],
+            {'film_work_type_created_at_idx'},
+        ),
+        'persons by created_at': (
+            Person.objects.order_by('-created_at', '-pk')[:CHANGE_LIST_LIMIT],
+            {'person_created_at_id_idx'},
+        ),
+        'persons by full_name': (
+            Person.objects.order_by('full_name', 'pk')[:CHANGE_LIST_LIMIT],
+            {'person_full_name_id_idx'},
+        ),
+        'film work genres': (
+            GenreFilmwork.objects.filter(film_work_id__in=film_work_ids),
+            get_leading_column_indexes('genre_film_work', 'film_work_id'),
+        ),
+        'film work persons': (
+            PersonFilmwork.objects.filter(film_work_id__in=film_work_ids),
+            get_leading_column_indexes('person_film_work', 'film_work_id'),
+        ),
+        'person film works': (
+            PersonFilmwork.objects.filter(person_id=person_id),
+            {'person_film_work_person_id_idx'},
+        ),
+        'genre film works': (
+            GenreFilmwork.objects.filter(genre_id=genre_id),
+            {'genre_film_work_genre_id_idx'},
+        ),
+    }
+
+
+def iter_plan_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from iter_plan_nodes(child)
+
+
+class Command(BaseCommand):
+    help = 'Check that the main admin queries are served by the ' \
+           'indexes meant for them'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--disable-seqscan',
+            action='store_true',
+            help='disable sequential scans to check that the indexes are '
+                 'usable at all, for databases too small for the planner '
+                 'to prefer them',
+        )
+
+    def handle(self, *args, **options):
+        failed = []
+        with transaction.atomic():
+            if options['disable_seqscan']:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            for name, (queryset, expected) in get_admin_queries().items():
+                plan = json.loads(queryset.explain(format='json'))[0]['Plan']
+                index_names = [
+                    node['Index Name'] for node in iter_plan_nodes(plan)
+                    if 'Index Name' in node
+                ]
+                if expected.isdisjoint(index_names):
+                    failed.append(name)
+                    self.stdout.write(self.style.ERROR(
+                        f'{name}: expected {" or ".join(sorted(expected))}, '
+                        f'got {", ".join(index_names) or "no index"}'
+                    ))
+                else:
+                    self.stdout.write(self.style.SUCCESS(
+                        f'{name}: {", ".join(index_names)}'
+                    ))
+        if failed:
+            raise CommandError(
+                f'{len(failed)} admin queries are not served by their index'
+            )
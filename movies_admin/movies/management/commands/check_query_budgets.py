@@ -0,0 +1,63 @@
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from movies.profiling import assert_max_queries
+
+
+def get_admin_urls(model, views):
+    opts = model._meta
+    obj = model.objects.order_by('pk').first()
+    for view in views:
+        url_name = f'admin:{opts.app_label}_{opts.model_name}_{view}'
+        if view == 'changelist':
+            yield view, reverse(url_name)
+        elif obj is not None:
+            yield view, reverse(url_name, args=(obj.pk,))
+
+
+class Command(BaseCommand):
+    help = 'Check that the admin change lists and change forms stay ' \
+           'within their query budgets'
+
+    def handle(self, *args, **options):
+        failed = []
+        allowed_hosts = [*settings.ALLOWED_HOSTS, 'testserver']
+        with transaction.atomic(), override_settings(
+            ALLOWED_HOSTS=allowed_hosts
+        ):
+            client = Client()
+            client.force_login(get_user_model().objects.create_superuser(
+                'query-budget-check', password=None
+            ))
+            for label, budgets in settings.ADMIN_QUERY_BUDGETS.items():
+                model = apps.get_model(label)
+                for view, url in get_admin_urls(model, budgets):
+                    name = f'{label} {view}'
+                    try:
+                        with assert_max_queries(budgets[view]) as profiler:
+                            response = client.get(url)
+                    except AssertionError as e:
+                        failed.append(name)
+                        self.stdout.write(self.style.ERROR(f'{name}: {e}'))
+                        continue
+                    if response.status_code != 200:
+                        failed.append(name)
+                        self.stdout.write(self.style.ERROR(
+                            f'{name}: status {response.status_code}'
+                        ))
+                        continue
+                    self.stdout.write(self.style.SUCCESS(
+                        f'{name}: {profiler.count} queries, '
+                        f'budget {budgets[view]}'
+                    ))
+            transaction.set_rollback(True)
+        if failed:
+            raise CommandError(
+                f'{len(failed)} admin views are over their query budget'
+            )
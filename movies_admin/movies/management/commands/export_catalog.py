@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from movies.exports import EXPORT_FORMATS, EXPORTS, iter_export
+
+
+class Command(BaseCommand):
+    help = 'Stream the film catalog to a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'export', nargs='?', choices=list(EXPORTS), default='film_works'
+        )
+        parser.add_argument(
+            '--format', choices=list(EXPORT_FORMATS), default='ndjson'
+        )
+        parser.add_argument(
+            '--output', help='file to write to instead of standard output'
+        )
+
+    def handle(self, *args, **options):
+        columns, get_rows = EXPORTS[options['export']]
+        chunks = iter_export(get_rows(), columns, options['format'])
+        if options['output'] is None:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+        with open(options['output'], 'w', encoding='utf-8',
+                  newline='') as output:
+            output.writelines(chunks)
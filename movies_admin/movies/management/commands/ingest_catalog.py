@@ -0,0 +1,63 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from movies.ingest import (INGEST_BATCH_SIZE, CatalogIngestor, read_csv,
+                           read_ndjson)
+
+READERS = {
+    'ndjson': read_ndjson,
+    'csv': read_csv,
+}
+FORMAT_SUFFIXES = {
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+    '.sqlite': 'sqlite',
+    '.db': 'sqlite',
+}
+
+
+class Command(BaseCommand):
+    help = 'Load films with their genres and persons from an NDJSON, CSV ' \
+           'or SQLite file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=Path)
+        parser.add_argument(
+            '--format', choices=[*READERS, 'sqlite'],
+            help='source format, detected from the file suffix by default',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=INGEST_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        source_format = (
+            options['format'] or FORMAT_SUFFIXES.get(path.suffix, 'ndjson')
+        )
+        ingestor = CatalogIngestor(options['batch_size'], self.report_skip)
+
+        started_at = time.perf_counter()
+        if source_format == 'sqlite':
+            ingestor.ingest_sqlite(path)
+        else:
+            ingestor.ingest_records(READERS[source_format](path))
+        elapsed = time.perf_counter() - started_at
+
+        skipped = ingestor.counts.pop('skipped', 0)
+        rows = sum(ingestor.counts.values())
+        for model_name, count in ingestor.counts.items():
+            self.stdout.write(f'{model_name}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{rows} rows in {elapsed:.2f}s ({rows / elapsed:.0f} rows/s), '
+            f'{skipped} records skipped'
+        ))
+
+    def report_skip(self, record, error):
+        self.stderr.write(
+            f'Skipped {record.get("id") or repr(record.get("title"))}: '
+            f'{"; ".join(error.messages)}'
+        )
@@ -0,0 +1,223 @@
+import statistics
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from itertools import cycle, islice
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.urls import reverse
+
+from movies.admin import FilmworkAdmin
+from movies.changelist import AFTER_VAR, encode_cursor
+from movies.models import Filmwork, Person, PersonFilmwork
+
+DEEP_PAGE = 100
+
+
+def get_admin_scenarios():
+    film_works_url = reverse('admin:movies_filmwork_changelist')
+    persons_url = reverse('admin:movies_person_changelist')
+    scenarios = {
+        'film works': film_works_url,
+        'film works filtered': f'{film_works_url}?type=movie',
+        'film works by rating, deep page':
+            f'{film_works_url}?o=-8&p={DEEP_PAGE}',
+        'persons': persons_url,
+    }
+
+    title = Filmwork.objects.values_list('title', flat=True).first()
+    if title:
+        scenarios['film works search'] = (
+            f'{film_works_url}?q={quote(title.split()[0])}'
+        )
+    full_name = Person.objects.values_list('full_name', flat=True).first()
+    if full_name:
+        scenarios['persons search'] = (
+            f'{persons_url}?q={quote(full_name.split()[0])}'
+        )
+
+    deep_film_work = Filmwork.objects.order_by('-created_at', '-pk')[
+        DEEP_PAGE * FilmworkAdmin.list_per_page:
+    ].first()
+    if deep_film_work is not None:
+        cursor = encode_cursor(
+            deep_film_work, Filmwork._meta.get_field('created_at')
+        )
+        scenarios['film works, deep keyset page'] = (
+            f'{film_works_url}?{urlencode({AFTER_VAR: cursor})}'
+        )
+
+    for name, field in (('film work', 'film_work'), ('person', 'person')):
+        pk = PersonFilmwork.objects.values(field).annotate(
+            roles=Count('pk')
+        ).order_by('-roles').values_list(field, flat=True).first()
+        if pk is not None:
+            scenarios[f'{name} change form, largest inline'] = reverse(
+                f'admin:movies_{field.replace("_", "")}_change', args=(pk,)
+            )
+    return scenarios
+
+
+def check_admin_user(username):
+    if not username:
+        raise CommandError('--admin requires --username and --password')
+    user_model = get_user_model()
+    users = user_model.objects.filter(
+        **{user_model.USERNAME_FIELD: username},
+        is_active=True,
+        is_staff=True,
+    )
+    if not users.exists():
+        raise CommandError(f'{username} is not an active staff user')
+
+
+def login(opener, cookie_jar, base_url, username, password):
+    login_url = f'{base_url}{reverse("admin:login")}'
+    try:
+        opener.open(login_url).read()
+        csrf_token = next(
+            cookie.value for cookie in cookie_jar
+            if cookie.name == settings.CSRF_COOKIE_NAME
+        )
+        data = urlencode({
+            'username': username,
+            'password': password,
+            'csrfmiddlewaretoken': csrf_token,
+            'next': reverse('admin:index'),
+        }).encode()
+        opener.open(Request(
+            login_url, data, headers={'Referer': login_url}
+        )).read()
+    except (StopIteration, URLError) as e:
+        raise CommandError(f'Could not log in at {login_url}: {e}') from e
+    if not any(cookie.name == settings.SESSION_COOKIE_NAME
+               for cookie in cookie_jar):
+        raise CommandError(f'Could not log in at {login_url} as {username}')
+
+
+def fetch(opener, name, url):
+    started_at = time.perf_counter()
+    try:
+        with opener.open(url) as response:
+            response.read()
+            status, headers = response.status, response.headers
+    except HTTPError as e:
+        status, headers = e.code, e.headers
+    except URLError as e:
+        raise CommandError(f'{url}: {e.reason}') from e
+    query_count = headers.get('X-Query-Count')
+    return (
+        name,
+        status,
+        time.perf_counter() - started_at,
+        None if query_count is None else int(query_count),
+    )
+
+
+def get_latency_report(latencies):
+    if not latencies:
+        return dict.fromkeys(('p50', 'p95', 'p99', 'max'))
+    if len(latencies) < 2:
+        percentiles = latencies * 99
+    else:
+        percentiles = statistics.quantiles(
+            latencies, n=100, method='inclusive'
+        )
+    return {
+        'p50': percentiles[49],
+        'p95': percentiles[94],
+        'p99': percentiles[98],
+        'max': max(latencies),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Send concurrent GET requests to a running server and report ' \
+           'latency percentiles and query counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', nargs='*',
+            help='paths to request in turn, /api/v1/movies/ by default',
+        )
+        parser.add_argument('--url', default='http://127.0.0.1:8000')
+        parser.add_argument(
+            '--admin', action='store_true',
+            help='request the main admin pages built from the database '
+                 'instead of the given paths',
+        )
+        parser.add_argument('--username')
+        parser.add_argument('--password')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument(
+            '--warmup', type=int, default=20,
+            help='requests sent before measuring',
+        )
+
+    def handle(self, *args, **options):
+        base_url = options['url'].rstrip('/')
+        if options['admin']:
+            check_admin_user(options['username'])
+            scenarios = get_admin_scenarios()
+        else:
+            scenarios = {
+                path: path for path in options['paths'] or ['/api/v1/movies/']
+            }
+
+        cookie_jar = CookieJar()
+        opener = build_opener(HTTPCookieProcessor(cookie_jar))
+        if options['username']:
+            login(opener, cookie_jar, base_url, options['username'],
+                  options['password'])
+
+        requests = [(opener, name, f'{base_url}{path}')
+                    for name, path in scenarios.items()]
+        for request in islice(cycle(requests), options['warmup']):
+            fetch(*request)
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(options['concurrency']) as executor:
+            results = list(executor.map(
+                lambda request: fetch(*request),
+                islice(cycle(requests), options['requests']),
+            ))
+        elapsed = time.perf_counter() - started_at
+
+        by_scenario = defaultdict(list)
+        for result in results:
+            by_scenario[result[0]].append(result)
+        width = max(map(len, [*scenarios, 'total']))
+        self.stdout.write(
+            f'{"":<{width}} {"count":>6} {"errors":>6} {"p50":>8} '
+            f'{"p95":>8} {"p99":>8} {"max":>8} {"queries":>7}'
+        )
+        for name, rows in [*by_scenario.items(), ('total', results)]:
+            self.write_report(name, rows, width)
+        self.stdout.write(
+            f'{len(results)} requests in {elapsed:.2f}s '
+            f'({len(results) / elapsed:.0f} req/s)'
+        )
+
+    def write_report(self, name, rows, width):
+        errors = sum(status >= 400 for _, status, _, _ in rows)
+        report = get_latency_report([latency for _, _, latency, _ in rows])
+        query_counts = [count for *_, count in rows if count is not None]
+        queries = (
+            f'{statistics.median(query_counts):.0f}' if query_counts else '-'
+        )
+        latencies = ' '.join(
+            f'{"-":>8}' if value is None else f'{value * 1000:>6.1f}ms'
+            for value in report.values()
+        )
+        self.stdout.write(
+            f'{name:<{width}} {len(rows):>6} {errors:>6} {latencies} '
+            f'{queries:>7}'
+        )
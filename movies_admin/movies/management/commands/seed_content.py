@@ -0,0 +1,135 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from movies.cache import bump_catalog_version
+from movies.models import PersonFilmwork
+
+WORDS = ('star', 'night', 'love', 'war', 'city', 'dream', 'river', 'ghost',
+         'king', 'road', 'winter', 'secret', 'game', 'storm', 'light',
+         'shadow', 'island', 'heart', 'fire', 'time',)
+FIRST_NAMES = ('John', 'Mary', 'Ivan', 'Anna', 'Peter', 'Olga', 'James',
+               'Maria', 'Alex', 'Elena',)
+LAST_NAMES = ('Smith', 'Ivanov', 'Brown', 'Petrova', 'Miller', 'Sokolov',
+              'Wilson', 'Kuznetsova', 'Taylor', 'Popov',)
+
+TABLES = ('film_work', 'genre', 'person', 'genre_film_work',
+          'person_film_work', 'film_work_document',)
+
+RANDOM_WORD = (
+    f'(%(words)s::text[])[1 + floor(random() * {len(WORDS)})::int]'
+)
+RANDOM_CREATED_AT = "NOW() - random() * INTERVAL '3 years'"
+
+SEED_SQL = f"""
+    CREATE TEMPORARY TABLE seed_genre ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS id, n
+    FROM generate_series(0, %(genres)s - 1) AS n;
+
+    CREATE TEMPORARY TABLE seed_person ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS id, n
+    FROM generate_series(0, %(persons)s - 1) AS n;
+
+    CREATE TEMPORARY TABLE seed_film_work ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS id, n
+    FROM generate_series(0, %(films)s - 1) AS n;
+
+    INSERT INTO content.genre (id, name, description, created_at,
+                               updated_at)
+    SELECT id, 'Genre ' || n, '', {RANDOM_CREATED_AT}, NOW()
+    FROM seed_genre;
+
+    INSERT INTO content.person (id, full_name, created_at, updated_at)
+    SELECT id,
+           (%(first_names)s::text[])[1 + n %% {len(FIRST_NAMES)}] || ' '
+           || (%(last_names)s::text[])[
+               1 + n / {len(FIRST_NAMES)} %% {len(LAST_NAMES)}
+           ]
+           || ' ' || n,
+           {RANDOM_CREATED_AT}, NOW()
+    FROM seed_person;
+
+    INSERT INTO content.film_work (id, title, description, creation_date,
+                                   file_path, rating, type, created_at,
+                                   updated_at)
+    SELECT id,
+           initcap({RANDOM_WORD}) || ' ' || {RANDOM_WORD} || ' ' || n,
+           'A ' || {RANDOM_WORD} || ' about ' || {RANDOM_WORD},
+           DATE '1950-01-01' + floor(random() * 27000)::int,
+           '',
+           round((random() * 10)::numeric, 1),
+           CASE WHEN random() < 0.8 THEN 'movie' ELSE 'tv_show' END,
+           {RANDOM_CREATED_AT}, NOW()
+    FROM seed_film_work;
+
+    INSERT INTO content.genre_film_work (id, film_work_id, genre_id,
+                                         created_at)
+    SELECT gen_random_uuid(), f.id, g.id, NOW()
+    FROM seed_film_work f
+    CROSS JOIN generate_series(0, %(genres_per_film)s - 1) AS k
+    JOIN seed_genre g ON g.n = (f.n * 7 + k) %% %(genres)s;
+
+    INSERT INTO content.person_film_work (id, film_work_id, person_id, role,
+                                          created_at)
+    SELECT gen_random_uuid(), f.id, p.id,
+           CASE k WHEN 0 THEN %(director)s WHEN 1 THEN %(writer)s
+                  ELSE %(actor)s END,
+           NOW()
+    FROM seed_film_work f
+    CROSS JOIN generate_series(0, %(persons_per_film)s - 1) AS k
+    JOIN seed_person p ON p.n = (f.n * 7919 + k) %% %(persons)s;
+
+    SELECT content.refresh_film_work_documents(
+        ARRAY(SELECT id FROM seed_film_work)
+    );
+"""
+
+
+class Command(BaseCommand):
+    help = 'Fill the content schema with synthetic films, persons and ' \
+           'genres using set-based inserts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--films', type=int, default=100000)
+        parser.add_argument('--persons', type=int, default=50000)
+        parser.add_argument('--genres', type=int, default=30)
+        parser.add_argument('--genres-per-film', type=int, default=2)
+        parser.add_argument('--persons-per-film', type=int, default=10)
+        parser.add_argument(
+            '--truncate',
+            action='store_true',
+            help='delete all existing content before seeding',
+        )
+
+    def handle(self, *args, **options):
+        if options['genres_per_film'] > options['genres']:
+            raise CommandError('--genres-per-film exceeds --genres')
+        if options['persons_per_film'] > options['persons']:
+            raise CommandError('--persons-per-film exceeds --persons')
+
+        params = {
+            'films': options['films'],
+            'persons': options['persons'],
+            'genres': options['genres'],
+            'genres_per_film': options['genres_per_film'],
+            'persons_per_film': options['persons_per_film'],
+            'words': list(WORDS),
+            'first_names': list(FIRST_NAMES),
+            'last_names': list(LAST_NAMES),
+            'actor': PersonFilmwork.Role.ACTOR,
+            'director': PersonFilmwork.Role.DIRECTOR,
+            'writer': PersonFilmwork.Role.WRITER,
+        }
+        tables = ', '.join(f'content.{table}' for table in TABLES)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SET LOCAL synchronous_commit = off')
+            if options['truncate']:
+                cursor.execute(f'TRUNCATE {tables}')
+            cursor.execute(SEED_SQL, params)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {tables}')
+        bump_catalog_version()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {options["films"]} films, {options["persons"]} persons '
+            f'and {options["genres"]} genres'
+        ))
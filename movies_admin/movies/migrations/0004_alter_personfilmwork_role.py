@@ -0,0 +1,18 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_alter_genrefilmwork_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='personfilmwork',
+            name='role',
+            field=models.TextField(choices=[('actor', 'actor'), ('director', 'director'), ('writer', 'writer')], verbose_name='role'),
+        ),
+    ]
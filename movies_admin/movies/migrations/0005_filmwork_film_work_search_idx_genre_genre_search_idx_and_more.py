@@ -0,0 +1,29 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:27
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from movies.operations import AddIndexIfNotExists
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_alter_personfilmwork_role'),
+    ]
+
+    operations = [
+        AddIndexIfNotExists(
+            model_name='filmwork',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title', 'description', config='simple'), name='film_work_search_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='genre',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', 'description', config='simple'), name='genre_search_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('full_name', config='simple'), name='person_search_idx'),
+        ),
+    ]
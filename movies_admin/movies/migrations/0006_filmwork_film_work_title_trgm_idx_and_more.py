@@ -0,0 +1,27 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:29
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+from movies.operations import AddIndexIfNotExists
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_filmwork_film_work_search_idx_genre_genre_search_idx_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexIfNotExists(
+            model_name='filmwork',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='film_work_title_trgm_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='person_full_name_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:32
+
+from django.db import migrations, models
+
+from movies.operations import AddIndexIfNotExists
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_filmwork_film_work_title_trgm_idx_and_more'),
+    ]
+
+    operations = [
+        AddIndexIfNotExists(
+            model_name='filmwork',
+            index=models.Index(fields=['created_at', 'id'], name='film_work_created_at_id_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='filmwork',
+            index=models.Index(fields=['title', 'id'], name='film_work_title_id_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='person',
+            index=models.Index(fields=['created_at', 'id'], name='person_created_at_id_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='person',
+            index=models.Index(fields=['full_name', 'id'], name='person_full_name_id_idx'),
+        ),
+    ]
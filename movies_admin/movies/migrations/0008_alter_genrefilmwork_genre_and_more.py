@@ -0,0 +1,76 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from movies.operations import AddIndexIfNotExists
+
+
+# AlterField does not find the old foreign key indexes because of the
+# schema-qualified db_table, so they are looked up by column instead.
+def drop_column_indexes_sql(table, column):
+    return f"""
+        DO $$
+        DECLARE
+            index_name text;
+        BEGIN
+            FOR index_name IN
+                SELECT i.relname
+                FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                JOIN pg_class t ON t.oid = x.indrelid
+                JOIN pg_attribute a
+                    ON a.attrelid = t.oid AND a.attnum = x.indkey[0]
+                WHERE t.oid = 'content.{table}'::regclass
+                    AND x.indnatts = 1
+                    AND NOT x.indisunique
+                    AND a.attname = '{column}'
+                    AND i.relname <> '{table}_{column}_idx'
+            LOOP
+                EXECUTE format('DROP INDEX content.%I', index_name);
+            END LOOP;
+        END $$;
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_filmwork_film_work_created_at_id_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='genrefilmwork',
+            name='genre',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='movies.genre', verbose_name='person'),
+        ),
+        migrations.AlterField(
+            model_name='personfilmwork',
+            name='person',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='movies.person', verbose_name='person'),
+        ),
+        migrations.RunSQL(
+            sql=[
+                drop_column_indexes_sql('genre_film_work', 'genre_id'),
+                drop_column_indexes_sql('person_film_work', 'person_id'),
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        AddIndexIfNotExists(
+            model_name='filmwork',
+            index=models.Index(fields=['rating', 'id'], name='film_work_rating_id_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='filmwork',
+            index=models.Index(fields=['type', 'created_at', 'id'], name='film_work_type_created_at_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='genrefilmwork',
+            index=models.Index(fields=['genre'], name='genre_film_work_genre_id_idx'),
+        ),
+        AddIndexIfNotExists(
+            model_name='personfilmwork',
+            index=models.Index(fields=['person'], name='person_film_work_person_id_idx'),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+REFRESH_FUNCTION_SQL = '''
+CREATE OR REPLACE FUNCTION content.refresh_film_work_documents(film_work_ids uuid[])
+RETURNS void AS $$
+    INSERT INTO content.film_work_document (film_work_id, document, updated_at)
+    SELECT
+        fw.id,
+        jsonb_build_object(
+            'id', fw.id,
+            'title', fw.title,
+            'description', fw.description,
+            'creation_date', fw.creation_date,
+            'rating', fw.rating,
+            'type', fw.type,
+            'genres', COALESCE(genres.names, '[]'),
+            'actors', COALESCE(persons.actors, '[]'),
+            'directors', COALESCE(persons.directors, '[]'),
+            'writers', COALESCE(persons.writers, '[]')
+        ),
+        NOW()
+    FROM content.film_work fw
+    LEFT JOIN LATERAL (
+        SELECT jsonb_agg(g.name ORDER BY g.name) AS names
+        FROM content.genre_film_work gfw
+        JOIN content.genre g ON g.id = gfw.genre_id
+        WHERE gfw.film_work_id = fw.id
+    ) genres ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT
+            jsonb_agg(p.full_name ORDER BY p.full_name)
+                FILTER (WHERE pfw.role = 'actor') AS actors,
+            jsonb_agg(p.full_name ORDER BY p.full_name)
+                FILTER (WHERE pfw.role = 'director') AS directors,
+            jsonb_agg(p.full_name ORDER BY p.full_name)
+                FILTER (WHERE pfw.role = 'writer') AS writers
+        FROM content.person_film_work pfw
+        JOIN content.person p ON p.id = pfw.person_id
+        WHERE pfw.film_work_id = fw.id
+    ) persons ON TRUE
+    WHERE film_work_ids IS NULL OR fw.id = ANY(film_work_ids)
+    ON CONFLICT (film_work_id) DO UPDATE
+    SET document = EXCLUDED.document, updated_at = EXCLUDED.updated_at;
+$$ LANGUAGE sql;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_alter_genrefilmwork_genre_and_more'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='FilmworkDocument',
+                    fields=[
+                        ('film_work', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='document', serialize=False, to='movies.filmwork', verbose_name='film_work')),
+                        ('document', models.JSONField(verbose_name='document')),
+                        ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated_at')),
+                    ],
+                    options={
+                        'verbose_name': 'film_work_document',
+                        'verbose_name_plural': 'film_work_documents',
+                        'db_table': 'content"."film_work_document',
+                    },
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql='''
+                    CREATE TABLE IF NOT EXISTS content.film_work_document (
+                        film_work_id uuid PRIMARY KEY
+                            REFERENCES content.film_work ON DELETE CASCADE,
+                        document jsonb NOT NULL,
+                        updated_at timestamp with time zone NOT NULL
+                    )
+                    ''',
+                    reverse_sql='DROP TABLE content.film_work_document',
+                ),
+            ],
+        ),
+        migrations.RunSQL(
+            sql=REFRESH_FUNCTION_SQL,
+            reverse_sql='DROP FUNCTION content.refresh_film_work_documents',
+        ),
+        migrations.RunSQL(
+            sql='SELECT content.refresh_film_work_documents(NULL)',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,8 +1,12 @@
 import uuid
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import connections, models
+from django.db.models.functions import Upper
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 
+from .search import build_search_vector
+
 
 class TimeStampedMixin(models.Model):
     created_at = models.DateTimeField(_('created_at'), auto_now_add=True)
@@ -27,6 +31,10 @@ class Genre(UUIDMixin, TimeStampedMixin):
         db_table = "content\".\"genre"
         verbose_name = _('genre')
         verbose_name_plural = _('genres')
+        indexes = [
+            GinIndex(build_search_vector('name', 'description'),
+                     name='genre_search_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -39,6 +47,16 @@ class Person(UUIDMixin, TimeStampedMixin):
         db_table = "content\".\"person"
         verbose_name = _('person')
         verbose_name_plural = _('persons')
+        indexes = [
+            GinIndex(build_search_vector('full_name'),
+                     name='person_search_idx'),
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'),
+                     name='person_full_name_trgm_idx'),
+            models.Index(fields=('created_at', 'id'),
+                         name='person_created_at_id_idx'),
+            models.Index(fields=('full_name', 'id'),
+                         name='person_full_name_id_idx'),
+        ]
 
     def __str__(self):
         return self.full_name
@@ -66,6 +84,20 @@ class Filmwork(UUIDMixin, TimeStampedMixin):
         db_table = "content\".\"film_work"
         verbose_name = _('film_work')
         verbose_name_plural = _('film_works')
+        indexes = [
+            GinIndex(build_search_vector('title', 'description'),
+                     name='film_work_search_idx'),
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'),
+                     name='film_work_title_trgm_idx'),
+            models.Index(fields=('created_at', 'id'),
+                         name='film_work_created_at_id_idx'),
+            models.Index(fields=('title', 'id'),
+                         name='film_work_title_id_idx'),
+            models.Index(fields=('rating', 'id'),
+                         name='film_work_rating_id_idx'),
+            models.Index(fields=('type', 'created_at', 'id'),
+                         name='film_work_type_created_at_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -75,7 +107,7 @@ class GenreFilmwork(UUIDMixin):
     film_work = models.ForeignKey('Filmwork', on_delete=models.CASCADE,
                                   verbose_name=_('film_work'))
     genre = models.ForeignKey('Genre', on_delete=models.CASCADE,
-                              verbose_name=_('person'))
+                              verbose_name=_('person'), db_index=False)
     created_at = models.DateTimeField(_('created_at'), auto_now_add=True)
 
     class Meta:
@@ -83,14 +115,23 @@ class GenreFilmwork(UUIDMixin):
         verbose_name = _('genre_film_work')
         verbose_name_plural = _('genre_film_works')
         unique_together = ['genre', 'film_work']
+        indexes = [
+            models.Index(fields=('genre',),
+                         name='genre_film_work_genre_id_idx'),
+        ]
 
 
 class PersonFilmwork(UUIDMixin):
+    class Role(models.TextChoices):
+        ACTOR = "actor", _('actor')
+        DIRECTOR = "director", _('director')
+        WRITER = "writer", _('writer')
+
     film_work = models.ForeignKey('Filmwork', on_delete=models.CASCADE,
                                   verbose_name=_('film_work'))
     person = models.ForeignKey('Person', on_delete=models.CASCADE,
-                               verbose_name=_('person'))
-    role = models.TextField(_('role'))
+                               verbose_name=_('person'), db_index=False)
+    role = models.TextField(_('role'), choices=Role.choices)
     created_at = models.DateTimeField(_('created_at'), auto_now_add=True)
 
     class Meta:
@@ -98,3 +139,32 @@ class PersonFilmwork(UUIDMixin):
         verbose_name = _('person_film_work')
         verbose_name_plural = _('person_film_works')
         unique_together = ['film_work', 'person', 'role']
+        indexes = [
+            models.Index(fields=('person',),
+                         name='person_film_work_person_id_idx'),
+        ]
+
+
+class FilmworkDocumentManager(models.Manager):
+    def refresh(self, film_work_ids=None):
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                'SELECT content.refresh_film_work_documents(%s::uuid[])',
+                [film_work_ids],
+            )
+
+
+class FilmworkDocument(models.Model):
+    film_work = models.OneToOneField('Filmwork', on_delete=models.CASCADE,
+                                     primary_key=True,
+                                     related_name='document',
+                                     verbose_name=_('film_work'))
+    document = models.JSONField(_('document'))
+    updated_at = models.DateTimeField(_('updated_at'), auto_now=True)
+
+    objects = FilmworkDocumentManager()
+
+    class Meta:
+        db_table = "content\".\"film_work_document"
+        verbose_name = _('film_work_document')
+        verbose_name_plural = _('film_work_documents')
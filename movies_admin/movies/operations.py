@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+class AddIndexIfNotExists(migrations.AddIndex):
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            statement = self.index.create_sql(model, schema_editor)
+            statement.template = statement.template.replace(
+                'CREATE INDEX ', 'CREATE INDEX IF NOT EXISTS ', 1
+            )
+            schema_editor.execute(statement, params=None)
+
+    def describe(self):
+        return f'{super().describe()} if it does not exist'
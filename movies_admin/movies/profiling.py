@@ -0,0 +1,69 @@
+import logging
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProfiler:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started_at
+            self.count += 1
+
+
+@contextmanager
+def profile_queries(using=DEFAULT_DB_ALIAS):
+    profiler = QueryProfiler()
+    with connections[using].execute_wrapper(profiler):
+        yield profiler
+
+
+@contextmanager
+def assert_max_queries(budget, using=DEFAULT_DB_ALIAS):
+    with profile_queries(using) as profiler:
+        yield profiler
+    if profiler.count > budget:
+        raise AssertionError(
+            f'{profiler.count} queries executed, the budget is {budget}'
+        )
+
+
+class QueryProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.path_prefixes = tuple(settings.PROFILING_PATH_PREFIXES)
+
+    def __call__(self, request):
+        if not request.path.startswith(self.path_prefixes):
+            return self.get_response(request)
+
+        started_at = time.perf_counter()
+        with profile_queries() as profiler:
+            response = self.get_response(request)
+        total_time = (time.perf_counter() - started_at) * 1000
+        db_time = profiler.duration * 1000
+
+        response.headers['X-Query-Count'] = str(profiler.count)
+        response.headers['X-DB-Time'] = f'{db_time:.1f}'
+        response.headers['Server-Timing'] = (
+            f'db;dur={db_time:.1f};desc="{profiler.count} queries", '
+            f'total;dur={total_time:.1f}'
+        )
+        view_name = getattr(request.resolver_match, 'view_name', None)
+        logger.info(
+            '%s %s (%s) %s: %d queries, %.1f ms db, %.1f ms total',
+            request.method, request.path, view_name, response.status_code,
+            profiler.count, db_time, total_time,
+        )
+        return response
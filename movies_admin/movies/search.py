@@ -0,0 +1,66 @@
+import re
+import uuid
+
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, TrigramSimilarity,
+)
+from django.db.models import Q
+from django.db.models.functions import Upper
+
+SEARCH_CONFIG = 'simple'
+
+
+def build_search_vector(*fields):
+    return SearchVector(*fields, config=SEARCH_CONFIG)
+
+
+def build_prefix_query(search_term):
+    words = re.findall(r'\w+', search_term)
+    if not words:
+        return None
+    return SearchQuery(
+        ' & '.join(f'{word}:*' for word in words),
+        config=SEARCH_CONFIG,
+        search_type='raw',
+    )
+
+
+class FullTextSearchMixin:
+    search_vector_fields = ()
+    trigram_search_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        try:
+            return queryset.filter(pk=uuid.UUID(search_term)), False
+        except ValueError:
+            pass
+
+        filters = Q()
+        ranks = []
+
+        search_query = build_prefix_query(search_term)
+        if search_query is not None and self.search_vector_fields:
+            search_vector = build_search_vector(*self.search_vector_fields)
+            queryset = queryset.alias(search=search_vector)
+            filters |= Q(search=search_query)
+            ranks.append(SearchRank(search_vector, search_query))
+
+        for field in self.trigram_search_fields:
+            upper_field = f'{field}_upper'
+            queryset = queryset.alias(**{upper_field: Upper(field)})
+            filters |= Q(**{f'{upper_field}__trigram_similar': search_term})
+            filters |= Q(**{f'{upper_field}__contains': search_term.upper()})
+            ranks.append(TrigramSimilarity(field, search_term))
+
+        if not ranks:
+            return queryset.none(), False
+
+        search_rank = ranks[0]
+        for rank in ranks[1:]:
+            search_rank += rank
+        queryset = queryset.alias(search_rank=search_rank)
+        return queryset.filter(filters).order_by('-search_rank'), False
@@ -0,0 +1,60 @@
+import threading
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_catalog_version
+from .models import (
+    Filmwork, FilmworkDocument, Genre, GenreFilmwork, Person, PersonFilmwork,
+)
+
+CATALOG_MODELS = (Filmwork, Genre, GenreFilmwork, Person, PersonFilmwork)
+
+pending = threading.local()
+
+
+def flush_catalog_changes():
+    film_work_ids = getattr(pending, 'film_work_ids', None)
+    if film_work_ids is None:
+        return
+    del pending.film_work_ids
+    if film_work_ids:
+        FilmworkDocument.objects.refresh(list(film_work_ids))
+    # Bumped only after the documents are rebuilt, so a concurrent request
+    # cannot cache an old document under the new version.
+    bump_catalog_version()
+
+
+def mark_catalog_changed(film_work_ids=()):
+    # Changes are collected until the first callback of the transaction
+    # runs, so a film saved with its inlines is refreshed once and the
+    # callbacks registered after it find nothing left to do.
+    if not hasattr(pending, 'film_work_ids'):
+        pending.film_work_ids = set()
+    pending.film_work_ids.update(film_work_ids)
+    transaction.on_commit(flush_catalog_changes)
+
+
+def get_changed_film_work_ids(instance, signal, created=False):
+    if isinstance(instance, Filmwork):
+        return [instance.pk] if signal is post_save else []
+    if isinstance(instance, (GenreFilmwork, PersonFilmwork)):
+        return [instance.film_work_id]
+    if signal is post_save and not created:
+        links = (
+            GenreFilmwork.objects.filter(genre=instance)
+            if isinstance(instance, Genre)
+            else PersonFilmwork.objects.filter(person=instance)
+        )
+        return links.values_list('film_work_id', flat=True)
+    return []
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_catalog(sender, instance, signal, **kwargs):
+    if sender in CATALOG_MODELS:
+        mark_catalog_changed(
+            get_changed_film_work_ids(instance, signal, kwargs.get('created'))
+        )
@@ -0,0 +1,172 @@
+import argparse
+import os
+import random
+import re
+import sqlite3
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from config import DDL_PATH
+
+ROLES = ("actor", "director", "writer")
+FILM_TYPES = ("movie", "tv_show")
+BATCH_SIZE = 10000
+
+
+def create_schema(conn: sqlite3.Connection, ddl_path: Path = DDL_PATH):
+    ddl = Path(ddl_path).read_text()
+    ddl = re.sub(r"CREATE (SCHEMA|EXTENSION)[^;]*;", "", ddl)
+    ddl = re.sub(r"CREATE INDEX[^;]*USING[^;]*;", "", ddl)
+    ddl = re.sub(
+        r"CREATE TABLE IF NOT EXISTS content\.film_work_document.*?\n\);",
+        "",
+        ddl,
+        flags=re.S,
+    )
+    ddl = re.sub(
+        r"CREATE OR REPLACE FUNCTION.*?\$\$.*?\$\$[^;]*;", "", ddl, flags=re.S
+    )
+    ddl = ddl.replace("content.", "")
+    conn.executescript(ddl)
+
+
+def _random_uuid(rng: random.Random):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _random_timestamp(rng: random.Random):
+    moment = datetime(2021, 1, 1, tzinfo=timezone.utc) + timedelta(
+        seconds=rng.randrange(365 * 24 * 3600), microseconds=rng.randrange(10**6)
+    )
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f+00")
+
+
+def _insert_batches(conn: sqlite3.Connection, table: str, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            conn.executemany(
+                f"INSERT INTO {table} VALUES ({', '.join('?' * len(row))})", batch
+            )
+            batch = []
+    if batch:
+        conn.executemany(
+            f"INSERT INTO {table} VALUES ({', '.join('?' * len(batch[0]))})", batch
+        )
+
+
+def generate_database(
+    path: str,
+    films: int,
+    persons: int,
+    genres: int,
+    person_film_works: int,
+    genres_per_film: int = 2,
+    seed: int = 0,
+):
+    if persons * len(ROLES) * films < person_film_works:
+        raise ValueError("Not enough films and persons for unique person_film_work")
+
+    rng = random.Random(seed)
+    if os.path.exists(path):
+        os.remove(path)
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    create_schema(conn)
+
+    film_ids = [_random_uuid(rng) for _ in range(films)]
+    genre_ids = [_random_uuid(rng) for _ in range(genres)]
+    person_ids = [_random_uuid(rng) for _ in range(persons)]
+
+    _insert_batches(
+        conn,
+        "film_work",
+        (
+            (
+                film_id,
+                f"Film {index}",
+                f"Synthetic description of film {index}",
+                f"{rng.randint(1950, 2023)}-01-01",
+                None,
+                round(rng.uniform(0, 10), 1),
+                rng.choice(FILM_TYPES),
+                _random_timestamp(rng),
+                _random_timestamp(rng),
+            )
+            for index, film_id in enumerate(film_ids)
+        ),
+    )
+    _insert_batches(
+        conn,
+        "genre",
+        (
+            (genre_id, f"Genre {index}", None, _random_timestamp(rng), None)
+            for index, genre_id in enumerate(genre_ids)
+        ),
+    )
+    _insert_batches(
+        conn,
+        "person",
+        (
+            (person_id, f"Person {index}", _random_timestamp(rng), None)
+            for index, person_id in enumerate(person_ids)
+        ),
+    )
+    _insert_batches(
+        conn,
+        "genre_film_work",
+        (
+            (_random_uuid(rng), film_id, genre_id, _random_timestamp(rng))
+            for film_id in film_ids
+            for genre_id in rng.sample(genre_ids, min(genres_per_film, genres))
+        ),
+    )
+    _insert_batches(
+        conn,
+        "person_film_work",
+        (
+            (
+                _random_uuid(rng),
+                film_ids[index % films],
+                person_ids[(index % films * 7919 + index // films) % persons],
+                ROLES[index // films // persons % len(ROLES)],
+                _random_timestamp(rng),
+            )
+            for index in range(person_film_works)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic SQLite movies database "
+        "(run as `python -m benchmarks.generate_sqlite`)"
+    )
+    parser.add_argument("--path", default="benchmark.sqlite")
+    parser.add_argument("--films", type=int, default=10000)
+    parser.add_argument("--persons", type=int, default=5000)
+    parser.add_argument("--genres", type=int, default=30)
+    parser.add_argument("--person-film-works", type=int, default=30000)
+    parser.add_argument("--genres-per-film", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    generate_database(
+        args.path,
+        args.films,
+        args.persons,
+        args.genres,
+        args.person_film_works,
+        args.genres_per_film,
+        args.seed,
+    )
+    print(f"Database {args.path} is generated!")
@@ -0,0 +1,223 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import queue
+import resource
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+import psycopg2
+from config import CHUNK_SIZE, DSL
+from load_data import (
+    closing,
+    load_from_sqlite,
+    load_from_sqlite_async,
+    load_from_sqlite_parallel,
+    table_name_model_mapping,
+)
+from psycopg2.extras import DictCursor
+from utils.metrics import LoadMetrics
+
+from benchmarks.generate_sqlite import generate_database
+
+RESULT_POLL_INTERVAL = 1
+
+
+def run_sequential(backend):
+    def run(sqlite_path, dsl, chunk_size, workers, metrics):
+        with closing(sqlite3.connect(sqlite_path)) as sqlite_conn, closing(
+            psycopg2.connect(**dsl, cursor_factory=DictCursor)
+        ) as pg_conn:
+            load_from_sqlite(
+                sqlite_conn, pg_conn, backend, chunk_size, metrics=metrics
+            )
+
+    return run
+
+
+def run_parallel(backend):
+    def run(sqlite_path, dsl, chunk_size, workers, metrics):
+        load_from_sqlite_parallel(
+            sqlite_path, dsl, workers, backend, chunk_size, metrics=metrics
+        )
+
+    return run
+
+
+def run_async(backend):
+    def run(sqlite_path, dsl, chunk_size, workers, metrics):
+        asyncio.run(
+            load_from_sqlite_async(
+                sqlite_path, dsl, backend, chunk_size, metrics=metrics
+            )
+        )
+
+    return run
+
+
+strategies = {
+    "insert": run_sequential("insert"),
+    "copy": run_sequential("copy"),
+    "parallel-insert": run_parallel("insert"),
+    "parallel-copy": run_parallel("copy"),
+    "async-insert": run_async("insert"),
+    "async-copy": run_async("copy"),
+}
+
+
+def truncate_tables(dsl: dict):
+    with closing(psycopg2.connect(**dsl)) as pg_conn:
+        tables = ", ".join(f"content.{table}" for table in table_name_model_mapping)
+        pg_conn.cursor().execute(f"TRUNCATE {tables} CASCADE")
+        pg_conn.commit()
+
+
+def count_rows(dsl: dict):
+    with closing(psycopg2.connect(**dsl)) as pg_conn:
+        curs = pg_conn.cursor()
+        counts = {}
+        for table in table_name_model_mapping:
+            curs.execute(f"SELECT COUNT(*) FROM content.{table}")
+            counts[table] = curs.fetchone()[0]
+        return counts
+
+
+def run_strategy(strategy, sqlite_path, dsl, chunk_size, workers, results):
+    truncate_tables(dsl)
+    metrics = LoadMetrics()
+    strategies[strategy](sqlite_path, dsl, chunk_size, workers, metrics)
+    metrics.finish()
+
+    summary = metrics.summary()
+    counts = count_rows(dsl)
+    rows = sum(counts.values())
+    results.put(
+        {
+            "strategy": strategy,
+            "elapsed": summary["elapsed"],
+            "rows": rows,
+            "rows_per_sec": rows / summary["elapsed"] if summary["elapsed"] else None,
+            "bytes_sent": summary["bytes_sent"],
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "tables": summary["tables"],
+        }
+    )
+
+
+def wait_for_result(process, results):
+    # A child that dies before putting its result would leave a plain
+    # results.get() blocked forever, so the queue is polled while it runs.
+    while process.exitcode is None:
+        try:
+            return results.get(timeout=RESULT_POLL_INTERVAL)
+        except queue.Empty:
+            pass
+    try:
+        return results.get(timeout=RESULT_POLL_INTERVAL)
+    except queue.Empty:
+        return None
+
+
+def run_benchmark(args):
+    context = multiprocessing.get_context("spawn")
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "sqlite_path": str(args.sqlite_path),
+        "chunk_size": args.chunk_size,
+        "workers": args.workers,
+        "results": [],
+    }
+    for strategy in args.strategies:
+        for repeat in range(args.repeat):
+            results = context.Queue()
+            process = context.Process(
+                target=run_strategy,
+                args=(
+                    strategy,
+                    args.sqlite_path,
+                    DSL,
+                    args.chunk_size,
+                    args.workers,
+                    results,
+                ),
+            )
+            process.start()
+            result = wait_for_result(process, results)
+            process.join()
+            if result is None:
+                report["results"].append(
+                    {
+                        "strategy": strategy,
+                        "repeat": repeat,
+                        "failed": True,
+                        "exitcode": process.exitcode,
+                    }
+                )
+                print(
+                    f"{strategy:>16} #{repeat}: failed with exit code "
+                    f"{process.exitcode}"
+                )
+                continue
+            result["repeat"] = repeat
+            report["results"].append(result)
+            print(
+                f"{strategy:>16} #{repeat}: {result['elapsed']:8.2f}s "
+                f"{result['rows_per_sec']:12.0f} rows/s "
+                f"{result['peak_rss_mb']:8.1f} MB peak RSS"
+            )
+            for table, timing in result["tables"].items():
+                shares = timing["phase_share"]
+                print(
+                    f"{'':>20}{table:<18}{timing['elapsed']:8.2f}s | "
+                    f"fetch {shares['fetch']:.0%} convert {shares['convert']:.0%} "
+                    f"write {shares['write']:.0%}"
+                )
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark sqlite_to_postgres loading strategies "
+        "(run as `python -m benchmarks.run_benchmark`)"
+    )
+    parser.add_argument("--sqlite-path", type=Path, default="benchmark.sqlite")
+    parser.add_argument(
+        "--generate",
+        action="store_true",
+        help="generate the SQLite database before running",
+    )
+    parser.add_argument("--films", type=int, default=10000)
+    parser.add_argument("--persons", type=int, default=5000)
+    parser.add_argument("--genres", type=int, default=30)
+    parser.add_argument("--person-film-works", type=int, default=30000)
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        choices=list(strategies),
+        default=list(strategies),
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.generate:
+        generate_database(
+            str(args.sqlite_path),
+            args.films,
+            args.persons,
+            args.genres,
+            args.person_film_works,
+        )
+    report = run_benchmark(args)
+    output = args.output or Path(f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results are saved to {output}")
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -11,3 +12,22 @@ DSL = {
     "host": os.environ.get("DB_HOST"),
     "port": os.environ.get("DB_PORT"),
 }
+
+CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE", 500))
+
+STATE_FILE_PATH = os.environ.get("STATE_FILE_PATH", "load_state.json")
+
+CHECKPOINT_FILE_PATH = os.environ.get("CHECKPOINT_FILE_PATH", "load_checkpoint.json")
+
+MIN_SPLIT_ROWS = int(os.environ.get("MIN_SPLIT_ROWS", 50000))
+
+ASYNC_QUEUE_SIZE = int(os.environ.get("ASYNC_QUEUE_SIZE", 4))
+
+DDL_PATH = Path(
+    os.environ.get(
+        "DDL_PATH",
+        Path(__file__).resolve().parent.parent
+        / "schema_design"
+        / "movies_database.ddl",
+    )
+)
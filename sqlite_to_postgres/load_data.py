@@ -1,14 +1,31 @@
+import argparse
+import asyncio
+import io
 import logging
 import sqlite3
 import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
+from functools import partial
 
 import psycopg2
-from config import DSL
+from config import (
+    ASYNC_QUEUE_SIZE,
+    CHECKPOINT_FILE_PATH,
+    CHUNK_SIZE,
+    DDL_PATH,
+    DSL,
+    MIN_SPLIT_ROWS,
+    STATE_FILE_PATH,
+)
 from psycopg2 import DatabaseError
 from psycopg2.extensions import connection as _connection
-from psycopg2.extras import DictCursor
+from psycopg2.extensions import make_dsn
+from psycopg2.extras import DictCursor, register_uuid
 from utils.movie_dataclasses import (
     Filmwork,
     Genre,
@@ -16,6 +33,15 @@ from utils.movie_dataclasses import (
     Person,
     PersonFilmwork,
 )
+from utils.metrics import LoadMetrics
+from utils.records import TableSchema
+from utils.scheduler import (
+    KeyRange,
+    get_load_order,
+    get_table_dependencies,
+    split_key_ranges,
+)
+from utils.state import JsonFileStorage, State
 
 table_name_model_mapping = {
     "film_work": Filmwork,
@@ -25,6 +51,29 @@ table_name_model_mapping = {
     "person_film_work": PersonFilmwork,
 }
 
+table_schemas = {
+    table_name: TableSchema.from_record_class(table_name, model)
+    for table_name, model in table_name_model_mapping.items()
+}
+
+table_dependencies = get_table_dependencies(table_name_model_mapping, DDL_PATH)
+
+register_uuid()
+
+
+def get_watermark_fields(table_name: str):
+    columns = table_schemas[table_name].columns
+    return tuple(field for field in ("updated_at", "created_at") if field in columns)
+
+
+def get_last_key(row: tuple, watermark_indexes: list = None):
+    if watermark_indexes is None:
+        return [row[0]]
+    watermark = next(
+        (row[index] for index in watermark_indexes if row[index] is not None), ""
+    )
+    return [watermark, row[0]]
+
 
 @contextmanager
 def closing(conn):
@@ -38,6 +87,9 @@ def closing(conn):
 class DataTable:
     name: str = None
     data: list = None
+    last_key: list = None
+    fetch_time: float = 0.0
+    convert_time: float = 0.0
 
 
 @dataclass
@@ -50,40 +102,102 @@ class DataTables:
 
 
 class SQLiteExtractor:
-    def __init__(self, connection: sqlite3.Connection):
+    def __init__(self, connection: sqlite3.Connection, chunk_size: int = CHUNK_SIZE):
         self.connection = connection
+        self.chunk_size = chunk_size
 
-    def _execute_query(self, query):
-        records = []
+    def _iter_query(self, query, params=()):
         try:
             curs = self.connection.cursor()
-            curs.execute(query)
+            curs.execute(query, params)
             while True:
-                rows = curs.fetchmany(20)
-                if rows:
-                    for row in rows:
-                        records.append(row)
-                else:
+                rows = curs.fetchmany(self.chunk_size)
+                if not rows:
                     break
-            return records
+                yield rows
         except sqlite3.Error as e:
             logging.error(f"SQLite error while executing the query: {e}")
             raise
 
+    def _execute_query(self, query, params=()):
+        records = []
+        for rows in self._iter_query(query, params):
+            records.extend(rows)
+        return records
+
     def _get_tables(self):
         query = "SELECT * FROM sqlite_master WHERE type='table';"
         return self._execute_query(query)
 
-    def _create_records(self, rows, record_class):
-        records = []
-        for row in rows:
-            try:
-                record = record_class(*row)
-                records.append(record)
-            except Exception as e:
-                logging.error(f"Error on creating a record: {e}")
-                raise
-        return records
+    def get_table_names(self):
+        existing_tables = {table[1] for table in self._get_tables()}
+        return [
+            table_name
+            for table_name in get_load_order(table_dependencies)
+            if table_name in existing_tables
+        ]
+
+    def _create_records(self, rows, table_schema: TableSchema):
+        try:
+            return table_schema.create_records(rows)
+        except Exception as e:
+            logging.error(f"Error on creating a record: {e}")
+            raise
+
+    def extract_table(
+        self,
+        table_name: str,
+        key_range: KeyRange = KeyRange(),
+        incremental: bool = False,
+        since: list = None,
+        after_id: str = None,
+    ):
+        table_schema = table_schemas[table_name]
+        columns = ", ".join(table_schema.columns)
+        conditions, params = key_range.conditions()
+        if incremental:
+            watermark_fields = get_watermark_fields(table_name)
+            watermark = f"COALESCE({', '.join(watermark_fields)}, '')"
+            watermark_indexes = [
+                table_schema.columns.index(field) for field in watermark_fields
+            ]
+            order_by = f" ORDER BY {watermark}, id"
+            if since is not None:
+                conditions.append(f"({watermark}, id) > (?, ?)")
+                params.extend([since[0] or "", since[1]])
+        else:
+            watermark_indexes = None
+            order_by = " ORDER BY id"
+            if after_id is not None:
+                conditions.append("id > ?")
+                params.append(after_id)
+        where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {columns} FROM {table_name}{where_clause}{order_by}"
+        row_chunks = self._iter_query(query, tuple(params))
+        while True:
+            started_at = time.perf_counter()
+            rows = next(row_chunks, None)
+            fetched_at = time.perf_counter()
+            if rows is None:
+                break
+            last_key = get_last_key(rows[-1], watermark_indexes)
+            records = self._create_records(rows, table_schema)
+            converted_at = time.perf_counter()
+            yield DataTable(
+                table_name,
+                records,
+                last_key,
+                fetched_at - started_at,
+                converted_at - fetched_at,
+            )
+
+    def stream_movies(self):
+        try:
+            for table_name in self.get_table_names():
+                yield from self.extract_table(table_name)
+        except Exception as e:
+            logging.error(f"Unexpected error: {e}")
+            raise
 
     def extract_movies(self):
         data_tables = DataTables(
@@ -93,87 +207,578 @@ class SQLiteExtractor:
             DataTable(),
             DataTable(),
         )
-        try:
-            tables = self._get_tables()
-            for table in tables:
-                table_name = table[1]
-                query = f"SELECT * FROM {table_name}"
-                rows = self._execute_query(query)
-                data_class_model = table_name_model_mapping[table_name]
-                data_class_data = self._create_records(rows, data_class_model)
-                setattr(data_tables, table_name, DataTable(table_name, data_class_data))
-            return data_tables
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        for chunk in self.stream_movies():
+            data_table = getattr(data_tables, chunk.name)
+            if data_table.data is None:
+                setattr(data_tables, chunk.name, DataTable(chunk.name, chunk.data))
+            else:
+                data_table.data.extend(chunk.data)
+        return data_tables
 
 
 class PostgresSaver:
-    def __init__(self, connection: _connection):
+    def __init__(
+        self,
+        connection: _connection,
+        backend: str = "insert",
+        upsert: bool = False,
+        metrics: LoadMetrics = None,
+    ):
         self.connection = connection
+        self.write_records = saver_backends[backend]
+        self.upsert = upsert
+        self.metrics = metrics
 
     def save_all_data(self, data_tables: DataTables):
         curs = self.connection.cursor()
         for _, data_table in data_tables.__dict__.items():
             if isinstance(data_table, DataTable) and data_table.data:
-                insert_table_records(data_table, curs)
+                self.write_records(data_table, curs, self.upsert)
+
+    def save_stream(self, chunks):
+        curs = self.connection.cursor()
+        is_saved = True
+        for chunk in chunks:
+            if not chunk.data:
+                continue
+            started_at = time.perf_counter()
+            bytes_sent = self.write_records(chunk, curs, self.upsert)
+            if bytes_sent is None:
+                is_saved = False
+            elif self.metrics is not None:
+                self.metrics.record_chunk(
+                    chunk.name,
+                    len(chunk.data),
+                    bytes_sent,
+                    chunk.fetch_time,
+                    chunk.convert_time,
+                    time.perf_counter() - started_at,
+                )
+        return is_saved
 
 
-def insert_table_records(data_table: DataTable, curs: DictCursor):
+def _on_conflict_clause(attribute_names: tuple[str, ...], upsert: bool):
+    if not upsert:
+        return "ON CONFLICT (id) DO NOTHING"
+    updates = ", ".join(
+        f"{name} = EXCLUDED.{name}" for name in attribute_names if name != "id"
+    )
+    return f"ON CONFLICT (id) DO UPDATE SET {updates}"
+
+
+def insert_table_records(data_table: DataTable, curs: DictCursor, upsert=False):
     try:
-        args = []
-        attribute_names = []
-        for item in data_table.data:
-            item_fields = fields(item)
-            attribute_names = [field.name for field in item_fields]
-            values = [getattr(item, field) for field in attribute_names]
-            args.append(
-                curs.mogrify(
-                    f"({', '.join(['%s']*len(attribute_names))})", tuple(values)
-                ).decode()
-            )
-        args_str = ",".join(args)
+        table_schema = table_schemas[data_table.name]
+        attribute_names = table_schema.columns
+        template = f"({', '.join(['%s'] * len(attribute_names))})"
+        args_str = ",".join(
+            curs.mogrify(template, table_schema.get_values(item)).decode()
+            for item in data_table.data
+        )
+        attribute_names_str = ", ".join(attribute_names)
+
+        query = f"""
+            INSERT INTO content.{data_table.name} ({attribute_names_str})
+            VALUES {args_str}
+            {_on_conflict_clause(attribute_names, upsert)}
+        """
+        curs.execute(query)
+
+        curs.connection.commit()
+        return len(query.encode())
+
+    except DatabaseError as e:
+        logging.error(f"Database error while insert data: {e}")
+        curs.connection.rollback()
+        return None
+
+    except Exception as e:
+        logging.error(f"Unexpected error: {e}")
+        raise
+
+
+copy_escapes = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    return str(value).translate(copy_escapes)
+
+
+def copy_table_records(data_table: DataTable, curs: DictCursor, upsert=False):
+    try:
+        table_schema = table_schemas[data_table.name]
+        attribute_names = table_schema.columns
         attribute_names_str = ", ".join(attribute_names)
+        staging_table = f"{data_table.name}_staging"
 
+        buffer = io.StringIO()
+        for item in data_table.data:
+            values = map(_copy_value, table_schema.get_values(item))
+            buffer.write("\t".join(values) + "\n")
+        bytes_sent = len(buffer.getvalue().encode())
+        buffer.seek(0)
+
+        curs.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {staging_table}
+            (LIKE content.{data_table.name}) ON COMMIT DELETE ROWS
+        """
+        )
+        curs.copy_expert(
+            f"COPY {staging_table} ({attribute_names_str}) FROM STDIN", buffer
+        )
         curs.execute(
             f"""
             INSERT INTO content.{data_table.name} ({attribute_names_str})
-            VALUES {args_str}
-            ON CONFLICT (id) DO NOTHING
+            SELECT {attribute_names_str} FROM {staging_table}
+            {_on_conflict_clause(attribute_names, upsert)}
         """
         )
 
         curs.connection.commit()
+        return bytes_sent
 
     except DatabaseError as e:
-        logging.error(f"Database error while insert data: {e}")
+        logging.error(f"Database error while copy data: {e}")
         curs.connection.rollback()
+        return None
 
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         raise
 
 
-def load_from_sqlite(connection: sqlite3.Connection, pg_conn: _connection):
-    postgres_saver = PostgresSaver(pg_conn)
-    sqlite_extractor = SQLiteExtractor(connection)
+saver_backends = {
+    "insert": insert_table_records,
+    "copy": copy_table_records,
+}
+
+
+def refresh_film_work_documents(pg_conn: _connection, changed_ids: dict = None):
+    curs = pg_conn.cursor()
+    try:
+        if changed_ids is None:
+            curs.execute("SELECT content.refresh_film_work_documents(NULL)")
+        else:
+            curs.execute(
+                """
+                SELECT content.refresh_film_work_documents(ARRAY(
+                    SELECT UNNEST(%(film_work)s::uuid[])
+                    UNION
+                    SELECT film_work_id FROM content.genre_film_work
+                    WHERE id = ANY(%(genre_film_work)s::uuid[])
+                    OR genre_id = ANY(%(genre)s::uuid[])
+                    UNION
+                    SELECT film_work_id FROM content.person_film_work
+                    WHERE id = ANY(%(person_film_work)s::uuid[])
+                    OR person_id = ANY(%(person)s::uuid[])
+                ))
+                """,
+                {
+                    table_name: changed_ids.get(table_name, [])
+                    for table_name in table_name_model_mapping
+                },
+            )
+        pg_conn.commit()
+        return True
+    except DatabaseError as e:
+        logging.error(f"Database error while refreshing film documents: {e}")
+        pg_conn.rollback()
+        return False
+
+
+def get_checkpoint_key(table_name: str, key_range: KeyRange):
+    if key_range == KeyRange():
+        return table_name
+    return f"{table_name}[{key_range.low or ''}:{key_range.high or ''}]"
+
+
+def load_table_with_checkpoints(
+    sqlite_extractor: SQLiteExtractor,
+    postgres_saver: PostgresSaver,
+    table_name: str,
+    key_range: KeyRange,
+    checkpoints: State,
+):
+    checkpoint_key = get_checkpoint_key(table_name, key_range)
+    checkpoint = checkpoints.get_state(
+        checkpoint_key, {"last_id": None, "rows": 0, "completed": False}
+    )
+    if checkpoint["completed"]:
+        logging.info(f"Skipping {checkpoint_key}: already loaded")
+        return
+
+    chunks = sqlite_extractor.extract_table(
+        table_name, key_range, after_id=checkpoint["last_id"]
+    )
+    for chunk in chunks:
+        if not postgres_saver.save_stream([chunk]):
+            logging.error(
+                f"Loading of {checkpoint_key} stopped after {checkpoint['rows']} rows"
+            )
+            return
+        checkpoint = {
+            "last_id": chunk.last_key[0],
+            "rows": checkpoint["rows"] + len(chunk.data),
+            "completed": False,
+        }
+        checkpoints.set_state(checkpoint_key, checkpoint)
+    checkpoints.set_state(checkpoint_key, {**checkpoint, "completed": True})
+
+
+def load_from_sqlite(
+    connection: sqlite3.Connection,
+    pg_conn: _connection,
+    backend: str = "insert",
+    chunk_size: int = CHUNK_SIZE,
+    state: State = None,
+    checkpoints: State = None,
+    metrics: LoadMetrics = None,
+):
+    sqlite_extractor = SQLiteExtractor(connection, chunk_size)
+
+    if state is None:
+        postgres_saver = PostgresSaver(pg_conn, backend, metrics=metrics)
+        if checkpoints is None:
+            postgres_saver.save_stream(sqlite_extractor.stream_movies())
+        else:
+            for table_name in sqlite_extractor.get_table_names():
+                load_table_with_checkpoints(
+                    sqlite_extractor,
+                    postgres_saver,
+                    table_name,
+                    KeyRange(),
+                    checkpoints,
+                )
+        refresh_film_work_documents(pg_conn)
+        return
+
+    postgres_saver = PostgresSaver(pg_conn, backend, upsert=True, metrics=metrics)
+    for table_name in sqlite_extractor.get_table_names():
+        high_water_mark = state.get_state(table_name)
+        chunks = sqlite_extractor.extract_table(
+            table_name, incremental=True, since=high_water_mark
+        )
+
+        # The watermark only moves past a chunk once the documents of the
+        # films it touches are rebuilt, so a failed refresh is retried by
+        # the next run together with the upsert.
+        for chunk in chunks:
+            changed_ids = {table_name: [record.id for record in chunk.data]}
+            if not (
+                postgres_saver.save_stream([chunk])
+                and refresh_film_work_documents(pg_conn, changed_ids)
+            ):
+                logging.error(
+                    f"Incremental sync of {table_name} stopped at {high_water_mark}"
+                )
+                break
+            high_water_mark = chunk.last_key
+            state.set_state(table_name, high_water_mark)
+
+
+def load_from_sqlite_parallel(
+    sqlite_path: str,
+    dsl: dict,
+    workers: int,
+    backend: str = "insert",
+    chunk_size: int = CHUNK_SIZE,
+    min_split_rows: int = MIN_SPLIT_ROWS,
+    checkpoints: State = None,
+    metrics: LoadMetrics = None,
+):
+    worker_state = threading.local()
+    opened_connections = []
+    opened_connections_lock = threading.Lock()
+
+    def get_worker_connections():
+        if not hasattr(worker_state, "pg_conn"):
+            worker_state.sqlite_conn = sqlite3.connect(
+                sqlite_path, check_same_thread=False
+            )
+            worker_state.pg_conn = psycopg2.connect(**dsl, cursor_factory=DictCursor)
+            with opened_connections_lock:
+                opened_connections.append(worker_state.sqlite_conn)
+                opened_connections.append(worker_state.pg_conn)
+        return worker_state.sqlite_conn, worker_state.pg_conn
+
+    def load_key_range(table_name: str, key_range: KeyRange):
+        sqlite_conn, pg_conn = get_worker_connections()
+        sqlite_extractor = SQLiteExtractor(sqlite_conn, chunk_size)
+        postgres_saver = PostgresSaver(pg_conn, backend, metrics=metrics)
+        if checkpoints is None:
+            chunks = sqlite_extractor.extract_table(table_name, key_range)
+            postgres_saver.save_stream(chunks)
+        else:
+            load_table_with_checkpoints(
+                sqlite_extractor, postgres_saver, table_name, key_range, checkpoints
+            )
+
+    with closing(sqlite3.connect(sqlite_path)) as sqlite_conn:
+        table_names = SQLiteExtractor(sqlite_conn).get_table_names()
+        key_ranges = {
+            table_name: split_key_ranges(
+                sqlite_conn, table_name, workers, min_split_rows
+            )
+            for table_name in table_names
+        }
+
+    pending_tables = {
+        table_name: table_dependencies[table_name] & set(table_names)
+        for table_name in table_names
+    }
+    remaining_ranges = {
+        table_name: len(ranges) for table_name, ranges in key_ranges.items()
+    }
+    loaded_tables = set()
+    futures = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_ready_tables():
+                ready_tables = [
+                    table_name
+                    for table_name, parents in pending_tables.items()
+                    if parents <= loaded_tables
+                ]
+                for table_name in ready_tables:
+                    del pending_tables[table_name]
+                    for key_range in key_ranges[table_name]:
+                        future = executor.submit(load_key_range, table_name, key_range)
+                        futures[future] = table_name
+
+            submit_ready_tables()
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    table_name = futures.pop(future)
+                    future.result()
+                    remaining_ranges[table_name] -= 1
+                    if not remaining_ranges[table_name]:
+                        loaded_tables.add(table_name)
+                submit_ready_tables()
+    finally:
+        for conn in opened_connections:
+            conn.close()
+
+    with closing(psycopg2.connect(**dsl)) as pg_conn:
+        refresh_film_work_documents(pg_conn)
+
+
+async def read_chunks(loop, executor, chunks, queue: asyncio.Queue):
+    while True:
+        chunk = await loop.run_in_executor(executor, next, chunks, None)
+        if chunk is None:
+            break
+        await queue.put(chunk)
+    await queue.put(None)
+
+
+async def write_chunks(loop, executor, postgres_saver, queue: asyncio.Queue):
+    is_saved = True
+    while (chunk := await queue.get()) is not None:
+        if not await loop.run_in_executor(
+            executor, postgres_saver.save_stream, [chunk]
+        ):
+            is_saved = False
+    return is_saved
+
 
-    data = sqlite_extractor.extract_movies()
-    postgres_saver.save_all_data(data)
+async def transfer_chunks(
+    loop, reader, writer, sqlite_conn, pg_conn, backend, chunk_size, queue_size, metrics
+):
+    queue = asyncio.Queue(maxsize=queue_size)
+    chunks = SQLiteExtractor(sqlite_conn, chunk_size).stream_movies()
+    postgres_saver = PostgresSaver(pg_conn, backend, metrics=metrics)
+    reader_task = asyncio.create_task(read_chunks(loop, reader, chunks, queue))
+    writer_task = asyncio.create_task(
+        write_chunks(loop, writer, postgres_saver, queue)
+    )
+    done, pending = await asyncio.wait(
+        (reader_task, writer_task), return_when=asyncio.FIRST_EXCEPTION
+    )
+    for task in pending:
+        task.cancel()
+    for task in done:
+        task.result()
+    await loop.run_in_executor(writer, refresh_film_work_documents, pg_conn)
+    return writer_task.result()
+
+
+async def load_from_sqlite_async(
+    sqlite_path: str,
+    dsl: dict,
+    backend: str = "insert",
+    chunk_size: int = CHUNK_SIZE,
+    queue_size: int = ASYNC_QUEUE_SIZE,
+    metrics: LoadMetrics = None,
+):
+    # sqlite3 and psycopg2 are blocking, so the reader and the writer each
+    # own a connection in a dedicated thread. Both release the GIL while
+    # waiting on I/O, so the next chunks are fetched and converted while the
+    # previous one is being written, and the bounded queue holds the reader
+    # back when PostgreSQL is the bottleneck.
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(1, "sqlite-reader") as reader, ThreadPoolExecutor(
+        1, "postgres-writer"
+    ) as writer:
+        sqlite_conn = await loop.run_in_executor(reader, sqlite3.connect, sqlite_path)
+        try:
+            pg_conn = await loop.run_in_executor(
+                writer, partial(psycopg2.connect, **dsl, cursor_factory=DictCursor)
+            )
+            try:
+                return await transfer_chunks(
+                    loop,
+                    reader,
+                    writer,
+                    sqlite_conn,
+                    pg_conn,
+                    backend,
+                    chunk_size,
+                    queue_size,
+                    metrics,
+                )
+            finally:
+                await loop.run_in_executor(writer, pg_conn.close)
+        finally:
+            await loop.run_in_executor(reader, sqlite_conn.close)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Transfer movies data from SQLite to PostgreSQL"
+    )
+    parser.add_argument("--sqlite-path", default="db.sqlite")
+    parser.add_argument(
+        "--backend",
+        choices=list(saver_backends),
+        default="insert",
+        help="insert: multi-row INSERT, copy: COPY through a staging table",
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="load independent tables and key ranges in parallel",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="overlap SQLite reads and PostgreSQL writes in a pipeline",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=ASYNC_QUEUE_SIZE,
+        help="chunks buffered between the reader and the writer in --async mode",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="upsert only rows changed since the previous incremental run",
+    )
+    parser.add_argument("--state-file", default=STATE_FILE_PATH)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue an interrupted load from the last committed chunks",
+    )
+    parser.add_argument("--checkpoint-file", default=CHECKPOINT_FILE_PATH)
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="save per-table and per-chunk timings as JSON",
+    )
+    parser.add_argument(
+        "--progress",
+        action=argparse.BooleanOptionalAction,
+        default=sys.stderr.isatty(),
+        help="show a live progress line on stderr",
+    )
+    args = parser.parse_args()
+    if args.resume and args.incremental:
+        parser.error("--resume can't be combined with --incremental")
+    if args.incremental and args.workers > 1:
+        parser.error("--incremental can't be combined with --workers")
+    if args.async_mode and (args.incremental or args.resume or args.workers > 1):
+        parser.error(
+            "--async can't be combined with --incremental, --resume or --workers"
+        )
+    return args
 
 
 if __name__ == "__main__":
-    with sqlite3.connect("db.sqlite") as sqlite_conn, closing(
-        psycopg2.connect(**DSL, cursor_factory=DictCursor)
-    ) as pg_conn:
-        print("Data transfer has started...")
-        load_from_sqlite(sqlite_conn, pg_conn)
-        print("Data transfer is completed!")
+    args = parse_args()
+    state = checkpoints = None
+    if args.incremental:
+        state = State(JsonFileStorage(args.state_file))
+    else:
+        checkpoint_storage = JsonFileStorage(args.checkpoint_file)
+        if not args.resume:
+            checkpoint_storage.save_state({})
+        checkpoints = State(checkpoint_storage)
+
+    metrics = LoadMetrics(progress=args.progress)
+
+    print(f"Data transfer has started ({args.backend} backend)...")
+    if args.async_mode:
+        asyncio.run(
+            load_from_sqlite_async(
+                args.sqlite_path,
+                DSL,
+                args.backend,
+                args.chunk_size,
+                args.queue_size,
+                metrics,
+            )
+        )
+    elif args.workers > 1:
+        load_from_sqlite_parallel(
+            args.sqlite_path,
+            DSL,
+            args.workers,
+            args.backend,
+            args.chunk_size,
+            checkpoints=checkpoints,
+            metrics=metrics,
+        )
+    else:
+        with sqlite3.connect(args.sqlite_path) as sqlite_conn, closing(
+            psycopg2.connect(**DSL, cursor_factory=DictCursor)
+        ) as pg_conn:
+            load_from_sqlite(
+                sqlite_conn,
+                pg_conn,
+                args.backend,
+                args.chunk_size,
+                state,
+                checkpoints,
+                metrics,
+            )
+    metrics.finish()
+    metrics.print_summary()
+    if args.metrics_file:
+        metrics.save(args.metrics_file)
+    print(f"Data transfer is completed in {metrics.elapsed:.2f}s!")
     run_tests = input("Start tests? (y/n): ").lower()
     if run_tests == "y":
         try:
             print("Running tests...")
-            subprocess.run(["python", "tests/check_consistency/main.py"])
+            subprocess.run(
+                [
+                    sys.executable,
+                    "tests/check_consistency/main.py",
+                    "--sqlite-path",
+                    args.sqlite_path,
+                    "--dsn",
+                    make_dsn(**DSL),
+                ]
+            )
         except Exception as e:
             logging.error(f"Error on running tests: {e}")
@@ -1,11 +1,18 @@
+import argparse
+import hashlib
 import os
 import sqlite3
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import date, datetime, timezone
 from enum import Enum
 
 import psycopg2
 from dotenv import load_dotenv
 from psycopg2.extensions import connection as _connection
+from psycopg2.extensions import make_dsn, parse_dsn
 from psycopg2.extras import DictCursor
 
 load_dotenv()
@@ -18,6 +25,10 @@ DSL = {
     "port": os.environ.get("DB_PORT"),
 }
 
+FETCH_SIZE = 1000
+BUCKET_PREFIX_LENGTH = 2
+MAX_REPORTED_IDS = 10
+
 
 @contextmanager
 def closing(conn):
@@ -35,7 +46,12 @@ class TablesNamesEnum(Enum):
     PERSON_FILM_WORK = "person_film_work"
 
 
-def compare_dbs(connection: sqlite3.Connection, pg_conn: _connection):
+def compare_dbs(
+    connection: sqlite3.Connection,
+    pg_conn: _connection,
+    sqlite_path: str = "db.sqlite",
+    dsl: dict = DSL,
+):
     msqlite_tables = get_msqlite_target_tables(connection)
     postgres_tables = get_postgres_target_tables(pg_conn)
     print("-" * 24)
@@ -46,9 +62,13 @@ def compare_dbs(connection: sqlite3.Connection, pg_conn: _connection):
     assert is_equal_fields_count(
         connection, pg_conn, msqlite_tables, postgres_tables
     ), "[Test 2][Fail] Unequal fields count in tables"
-    assert check_fields_consistency(
+    differing_buckets = check_fields_consistency(
         connection, pg_conn, msqlite_tables, postgres_tables
-    ), "[Test 3][Fail] Invalid fields consistency"
+    )
+    is_consistent = not differing_buckets
+    are_values_equal = check_column_values(sqlite_path, dsl, differing_buckets)
+    assert is_consistent, "[Test 3][Fail] Invalid fields consistency"
+    assert are_values_equal, "[Test 4][Fail] Column values mismatch"
     print("-" * 24)
     print("[Success] All tests passed!")
 
@@ -90,6 +110,88 @@ def get_postgres_target_tables(conn: _connection):
     return target_tables
 
 
+def get_postgres_columns(conn: _connection, table: str):
+    query = """SELECT column_name, data_type FROM information_schema.columns
+    WHERE table_schema = 'content' AND table_name = %s
+    ORDER BY ordinal_position;"""
+    curs = conn.cursor()
+    curs.execute(query, (table,))
+    return [(row[0], row[1]) for row in curs.fetchall()]
+
+
+def normalize_value(value, data_type: str):
+    if value is None:
+        return None
+    if data_type == "uuid":
+        return str(uuid.UUID(str(value)))
+    if data_type.startswith("timestamp"):
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+    if data_type == "date":
+        if isinstance(value, str):
+            return date.fromisoformat(value[:10]).isoformat()
+        return value.isoformat()
+    if data_type in ("double precision", "real", "numeric"):
+        return float(value)
+    return str(value)
+
+
+def row_digest(row: tuple, data_types: list[str]):
+    normalized = tuple(
+        normalize_value(value, data_type) for value, data_type in zip(row, data_types)
+    )
+    digest = hashlib.blake2b(repr(normalized).encode(), digest_size=8).digest()
+    return normalized[0], int.from_bytes(digest, "big")
+
+
+def iter_sqlite_rows(
+    conn: sqlite3.Connection, table: str, columns: list[str], where=""
+):
+    curs = conn.cursor()
+    curs.execute(f"SELECT {', '.join(columns)} FROM {table}{where}")
+    while True:
+        rows = curs.fetchmany(FETCH_SIZE)
+        if not rows:
+            break
+        yield from rows
+
+
+def iter_postgres_rows(conn: _connection, table: str, columns: list[str], where=""):
+    with conn.cursor(name=f"check_{table}") as curs:
+        curs.itersize = FETCH_SIZE
+        curs.execute(f"SELECT {', '.join(columns)} FROM content.{table}{where}")
+        yield from curs
+
+
+def get_bucket_hashes(rows, data_types: list[str]):
+    buckets = defaultdict(lambda: [0, 0])
+    for row in rows:
+        row_id, digest = row_digest(row, data_types)
+        bucket = buckets[row_id[:BUCKET_PREFIX_LENGTH]]
+        bucket[0] += 1
+        bucket[1] ^= digest
+    return buckets
+
+
+def get_bucket_bounds(prefix: str):
+    low = prefix.ljust(32, "0")
+    high = None
+    if int(prefix, 16) + 1 < 16 ** len(prefix):
+        high = format(int(prefix, 16) + 1, f"0{len(prefix)}x").ljust(32, "0")
+    return [str(uuid.UUID(bound)) if bound else None for bound in (low, high)]
+
+
+def get_bucket_condition(prefix: str, cast: str = ""):
+    low, high = get_bucket_bounds(prefix)
+    condition = f" WHERE id >= '{low}'{cast}"
+    if high is not None:
+        condition += f" AND id < '{high}'{cast}"
+    return condition
+
+
 def is_equal_fields_count(
     sqlite_conn: sqlite3.Connection,
     postgres_conn: _connection,
@@ -100,18 +202,20 @@ def is_equal_fields_count(
     postgres_tables_fields = []
 
     for table in msqlite_tables:
-        query = f"SELECT * FROM {table}"
+        query = f"SELECT COUNT(*) FROM {table}"
         curs = sqlite_conn.cursor()
         curs.execute(query)
-        data = curs.fetchall()
-        sqlite_tables_fields.append({"table_name": table, "fields": [len(data)]})
+        sqlite_tables_fields.append(
+            {"table_name": table, "fields": [curs.fetchone()[0]]}
+        )
 
     for table in postgres_tables:
-        query = f"SELECT * FROM content.{table}"
+        query = f"SELECT COUNT(*) FROM content.{table}"
         curs = postgres_conn.cursor()
         curs.execute(query)
-        data = curs.fetchall()
-        postgres_tables_fields.append({"table_name": table, "fields": [len(data)]})
+        postgres_tables_fields.append(
+            {"table_name": table, "fields": [curs.fetchone()[0]]}
+        )
 
     are_equal = all(
         item in postgres_tables_fields for item in sqlite_tables_fields
@@ -127,39 +231,156 @@ def check_fields_consistency(
     msqlite_tables: list[str],
     postgres_tables: list[str],
 ):
-    sqlite_tables_fields = []
-    postgres_tables_fields = []
-    flag = True
+    differing_buckets = {}
     for table in msqlite_tables:
-        query = f"SELECT * FROM {table}"
-        curs = sqlite_conn.cursor()
-        curs.execute(query)
-        data = curs.fetchall()
-        sqlite_tables_fields.append({"table_name": table, "fields": data})
+        if table not in postgres_tables:
+            continue
+        postgres_columns = get_postgres_columns(postgres_conn, table)
+        columns = [column for column, _ in postgres_columns]
+        data_types = [data_type for _, data_type in postgres_columns]
 
-    for table in postgres_tables:
-        query = f"SELECT * FROM content.{table}"
-        curs = postgres_conn.cursor()
-        curs.execute(query)
-        data = curs.fetchall()
-        postgres_tables_fields.append({"table_name": table, "fields": data})
+        sqlite_buckets = get_bucket_hashes(
+            iter_sqlite_rows(sqlite_conn, table, columns), data_types
+        )
+        postgres_buckets = get_bucket_hashes(
+            iter_postgres_rows(postgres_conn, table, columns), data_types
+        )
+        prefixes = sorted(
+            prefix
+            for prefix in sqlite_buckets.keys() | postgres_buckets.keys()
+            if sqlite_buckets.get(prefix) != postgres_buckets.get(prefix)
+        )
+        if prefixes:
+            differing_buckets[table] = prefixes
+            print(
+                f"[Test 3][Fail] {table}: {len(prefixes)} differing buckets, "
+                f"e.g. {prefixes[:MAX_REPORTED_IDS]}"
+            )
+    if not differing_buckets:
+        print("[Test 3][Success] Data consistency passed!")
+    return differing_buckets
 
-    for sqlite_table_fields in sqlite_tables_fields:
-        query = f"SELECT * FROM content.{sqlite_table_fields['table_name']}"
-        curs = postgres_conn.cursor()
-        curs.execute(query)
-        data = curs.fetchall()
-        for x in data:
-            x_formatted = tuple(x)
-            if not (x_formatted[0] in [x[0] for x in sqlite_table_fields["fields"]]):
+
+def merge_join_rows(sqlite_rows, postgres_rows, data_types: list[str]):
+    def normalize_rows(rows):
+        for row in rows:
+            yield tuple(
+                normalize_value(value, data_type)
+                for value, data_type in zip(row, data_types)
+            )
+
+    sqlite_rows = normalize_rows(sqlite_rows)
+    postgres_rows = normalize_rows(postgres_rows)
+    sqlite_row = next(sqlite_rows, None)
+    postgres_row = next(postgres_rows, None)
+    while sqlite_row is not None or postgres_row is not None:
+        if postgres_row is None or (
+            sqlite_row is not None and sqlite_row[0] < postgres_row[0]
+        ):
+            yield sqlite_row[0], sqlite_row, None
+            sqlite_row = next(sqlite_rows, None)
+        elif sqlite_row is None or postgres_row[0] < sqlite_row[0]:
+            yield postgres_row[0], None, postgres_row
+            postgres_row = next(postgres_rows, None)
+        else:
+            yield sqlite_row[0], sqlite_row, postgres_row
+            sqlite_row = next(sqlite_rows, None)
+            postgres_row = next(postgres_rows, None)
+
+
+def compare_table_values(
+    sqlite_path: str, dsl: dict, table: str, prefixes: list[str]
+):
+    # Only the buckets whose hashes differ are joined, and only the first few
+    # ids per column are kept, so a badly broken load does not hold every row
+    # id in memory.
+    mismatch_counts = Counter()
+    mismatch_ids = defaultdict(list)
+
+    def add_mismatch(column, row_id):
+        mismatch_counts[column] += 1
+        if len(mismatch_ids[column]) < MAX_REPORTED_IDS:
+            mismatch_ids[column].append(row_id)
+
+    with closing(sqlite3.connect(sqlite_path)) as sqlite_conn, closing(
+        psycopg2.connect(**dsl)
+    ) as postgres_conn:
+        postgres_columns = get_postgres_columns(postgres_conn, table)
+        columns = [column for column, _ in postgres_columns]
+        data_types = [data_type for _, data_type in postgres_columns]
+
+        for prefix in prefixes:
+            joined_rows = merge_join_rows(
+                iter_sqlite_rows(
+                    sqlite_conn,
+                    table,
+                    columns,
+                    f"{get_bucket_condition(prefix)} ORDER BY id",
+                ),
+                iter_postgres_rows(
+                    postgres_conn,
+                    table,
+                    columns,
+                    f"{get_bucket_condition(prefix, '::uuid')} ORDER BY id",
+                ),
+                data_types,
+            )
+            for row_id, sqlite_row, postgres_row in joined_rows:
+                if postgres_row is None:
+                    add_mismatch("<missing in postgres>", row_id)
+                elif sqlite_row is None:
+                    add_mismatch("<missing in sqlite>", row_id)
+                else:
+                    for column, sqlite_value, postgres_value in zip(
+                        columns, sqlite_row, postgres_row
+                    ):
+                        if sqlite_value != postgres_value:
+                            add_mismatch(column, row_id)
+    return table, mismatch_counts, mismatch_ids
+
+
+def check_column_values(sqlite_path: str, dsl: dict, differing_buckets: dict):
+    flag = True
+    max_workers = max(len(differing_buckets), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(compare_table_values, sqlite_path, dsl, table, prefixes)
+            for table, prefixes in differing_buckets.items()
+        ]
+        for future in futures:
+            table, mismatch_counts, mismatch_ids = future.result()
+            for column, count in mismatch_counts.items():
                 flag = False
+                print(
+                    f"[Test 4][Fail] {table}.{column}: {count} mismatches, "
+                    f"e.g. {mismatch_ids[column]}"
+                )
     if flag:
-        print("[Test 3][Success] Data consistency passed!")
+        print("[Test 4][Success] Column values passed!")
     return flag
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Check that PostgreSQL holds the same data as SQLite"
+    )
+    parser.add_argument("--sqlite-path", default="db.sqlite")
+    parser.add_argument(
+        "--dsn",
+        default=make_dsn(**DSL),
+        help="libpq connection string, built from the DB_* variables by default",
+    )
+    args = parser.parse_args()
+    # sqlite3.connect would silently create an empty database instead.
+    if not os.path.isfile(args.sqlite_path):
+        parser.error(f"{args.sqlite_path} does not exist")
+    return args
+
+
 if __name__ == "__main__":
-    with sqlite3.connect("db.sqlite") as sqlite_conn, closing(
-        psycopg2.connect(**DSL, cursor_factory=DictCursor)
+    args = parse_args()
+    dsl = parse_dsn(args.dsn)
+    with sqlite3.connect(args.sqlite_path) as sqlite_conn, closing(
+        psycopg2.connect(**dsl, cursor_factory=DictCursor)
     ) as pg_conn:
-        compare_dbs(sqlite_conn, pg_conn)
+        compare_dbs(sqlite_conn, pg_conn, args.sqlite_path, dsl)
@@ -0,0 +1,153 @@
+import json
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+PROGRESS_INTERVAL = 0.5
+
+
+@dataclass
+class TableMetrics:
+    rows: int = 0
+    chunks: int = 0
+    bytes_sent: int = 0
+    fetch_time: float = 0.0
+    convert_time: float = 0.0
+    write_time: float = 0.0
+    started_at: float = None
+    finished_at: float = None
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    def as_dict(self):
+        busy_time = self.fetch_time + self.convert_time + self.write_time
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "bytes_sent": self.bytes_sent,
+            "elapsed": self.elapsed,
+            "rows_per_sec": self.rows / self.elapsed if self.elapsed else None,
+            "fetch_time": self.fetch_time,
+            "convert_time": self.convert_time,
+            "write_time": self.write_time,
+            "phase_share": {
+                phase: getattr(self, f"{phase}_time") / busy_time if busy_time else 0
+                for phase in ("fetch", "convert", "write")
+            },
+        }
+
+
+@dataclass
+class ChunkMetrics:
+    table: str
+    rows: int
+    bytes_sent: int
+    fetch_time: float
+    convert_time: float
+    write_time: float
+
+
+class LoadMetrics:
+    def __init__(self, progress: bool = False, stream=sys.stderr):
+        self.progress = progress
+        self.stream = stream
+        self.tables = {}
+        self.chunks = []
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._last_progress_at = 0.0
+
+    def record_chunk(
+        self,
+        table: str,
+        rows: int,
+        bytes_sent: int,
+        fetch_time: float,
+        convert_time: float,
+        write_time: float,
+    ):
+        now = time.perf_counter()
+        with self._lock:
+            table_metrics = self.tables.setdefault(table, TableMetrics())
+            chunk_started_at = now - fetch_time - convert_time - write_time
+            if (
+                table_metrics.started_at is None
+                or chunk_started_at < table_metrics.started_at
+            ):
+                table_metrics.started_at = chunk_started_at
+            table_metrics.finished_at = now
+            table_metrics.rows += rows
+            table_metrics.chunks += 1
+            table_metrics.bytes_sent += bytes_sent
+            table_metrics.fetch_time += fetch_time
+            table_metrics.convert_time += convert_time
+            table_metrics.write_time += write_time
+            self.chunks.append(
+                ChunkMetrics(
+                    table, rows, bytes_sent, fetch_time, convert_time, write_time
+                )
+            )
+            if self.progress and now - self._last_progress_at >= PROGRESS_INTERVAL:
+                self._last_progress_at = now
+                self._print_progress(table, table_metrics)
+
+    def _print_progress(self, table: str, table_metrics: TableMetrics):
+        rows = sum(metrics.rows for metrics in self.tables.values())
+        megabytes_sent = sum_bytes(self.tables) / 2**20
+        shares = table_metrics.as_dict()["phase_share"]
+        self.stream.write(
+            f"\r[{table}] {table_metrics.rows:,} rows | total {rows:,} rows "
+            f"{rows / self.elapsed:,.0f} rows/s {megabytes_sent:,.1f} MB sent | "
+            f"fetch {shares['fetch']:.0%} convert {shares['convert']:.0%} "
+            f"write {shares['write']:.0%}\033[K"
+        )
+        self.stream.flush()
+
+    def finish(self):
+        self.finished_at = time.perf_counter()
+        if self.progress:
+            self.stream.write("\n")
+            self.stream.flush()
+
+    @property
+    def elapsed(self):
+        finished_at = self.finished_at or time.perf_counter()
+        return finished_at - self.started_at
+
+    def summary(self):
+        rows = sum(metrics.rows for metrics in self.tables.values())
+        return {
+            "elapsed": self.elapsed,
+            "rows": rows,
+            "rows_per_sec": rows / self.elapsed if self.elapsed else None,
+            "bytes_sent": sum_bytes(self.tables),
+            "tables": {
+                table: metrics.as_dict() for table, metrics in self.tables.items()
+            },
+        }
+
+    def save(self, file_path: Path):
+        report = self.summary()
+        report["chunks"] = [asdict(chunk) for chunk in self.chunks]
+        Path(file_path).write_text(json.dumps(report, indent=2))
+
+    def print_summary(self):
+        for table, metrics in self.summary()["tables"].items():
+            shares = metrics["phase_share"]
+            print(
+                f"{table:<18}{metrics['rows']:>12,} rows {metrics['elapsed']:8.2f}s "
+                f"{metrics['rows_per_sec'] or 0:>10,.0f} rows/s | "
+                f"fetch {shares['fetch']:.0%} convert {shares['convert']:.0%} "
+                f"write {shares['write']:.0%}"
+            )
+
+
+def sum_bytes(tables: dict):
+    return sum(metrics.bytes_sent for metrics in tables.values())
@@ -1,14 +1,14 @@
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Filmwork:
     id: uuid.UUID
     title: str
     description: str
-    creation_date: datetime
+    creation_date: date
     file_path: str
     rating: float
     type: str
@@ -16,7 +16,7 @@ class Filmwork:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Genre:
     id: uuid.UUID
     name: str
@@ -25,7 +25,7 @@ class Genre:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenreFilmwork:
     id: uuid.UUID
     film_work_id: uuid.UUID
@@ -33,7 +33,7 @@ class GenreFilmwork:
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Person:
     id: uuid.UUID
     full_name: str
@@ -41,7 +41,7 @@ class Person:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonFilmwork:
     id: uuid.UUID
     film_work_id: uuid.UUID
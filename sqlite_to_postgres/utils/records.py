@@ -0,0 +1,42 @@
+import uuid
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Callable
+
+type_converters = {
+    uuid.UUID: uuid.UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    float: float,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TableSchema:
+    name: str
+    record_class: type
+    columns: tuple[str, ...]
+    converters: tuple[tuple[int, Callable], ...]
+    get_values: attrgetter
+
+    @classmethod
+    def from_record_class(cls, name: str, record_class: type):
+        record_fields = fields(record_class)
+        columns = tuple(field.name for field in record_fields)
+        converters = tuple(
+            (index, type_converters[field.type])
+            for index, field in enumerate(record_fields)
+            if field.type in type_converters
+        )
+        return cls(name, record_class, columns, converters, attrgetter(*columns))
+
+    def create_records(self, rows: list[tuple]):
+        if not rows:
+            return []
+        columns = list(zip(*rows))
+        for index, converter in self.converters:
+            columns[index] = [
+                None if value is None else converter(value) for value in columns[index]
+            ]
+        return list(map(self.record_class, *columns))
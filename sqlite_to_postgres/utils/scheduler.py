@@ -0,0 +1,93 @@
+import re
+import sqlite3
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+create_table_pattern = re.compile(
+    r"CREATE TABLE IF NOT EXISTS content\.(\w+)\s*\((.*?)\);", re.DOTALL
+)
+references_pattern = re.compile(r"REFERENCES content\.(\w+)")
+
+
+@dataclass(frozen=True)
+class KeyRange:
+    low: str = None
+    high: str = None
+
+    def conditions(self):
+        conditions = []
+        params = []
+        if self.low is not None:
+            conditions.append("id >= ?")
+            params.append(self.low)
+        if self.high is not None:
+            conditions.append("id < ?")
+            params.append(self.high)
+        return conditions, params
+
+
+def parse_ddl_dependencies(ddl_path: Path):
+    ddl = Path(ddl_path).read_text()
+    return {
+        table_name: set(references_pattern.findall(body))
+        for table_name, body in create_table_pattern.findall(ddl)
+    }
+
+
+def get_table_dependencies(table_name_model_mapping: dict, ddl_path: Path = None):
+    ddl_dependencies = {}
+    if ddl_path is not None and Path(ddl_path).exists():
+        ddl_dependencies = parse_ddl_dependencies(ddl_path)
+
+    dependencies = {}
+    for table_name, model in table_name_model_mapping.items():
+        if table_name in ddl_dependencies:
+            parents = ddl_dependencies[table_name]
+        else:
+            parents = {
+                field.name.removesuffix("_id")
+                for field in fields(model)
+                if field.name.endswith("_id")
+            }
+        dependencies[table_name] = parents & table_name_model_mapping.keys()
+    return dependencies
+
+
+def get_load_order(dependencies: dict):
+    order = []
+    pending = dict(dependencies)
+    while pending:
+        ready = sorted(
+            table_name
+            for table_name, parents in pending.items()
+            if not parents - set(order)
+        )
+        if not ready:
+            raise ValueError(f"Circular dependency between tables: {sorted(pending)}")
+        order.extend(ready)
+        for table_name in ready:
+            del pending[table_name]
+    return order
+
+
+def split_key_ranges(
+    connection: sqlite3.Connection, table_name: str, parts: int, min_rows: int
+):
+    curs = connection.cursor()
+    curs.execute(f"SELECT COUNT(*) FROM {table_name}")
+    rows_count = curs.fetchone()[0]
+    if parts < 2 or rows_count < min_rows:
+        return [KeyRange()]
+
+    step = rows_count // parts
+    boundaries = []
+    for part in range(1, parts):
+        curs.execute(
+            f"SELECT id FROM {table_name} ORDER BY id LIMIT 1 OFFSET ?",
+            (part * step,),
+        )
+        boundaries.append(curs.fetchone()[0])
+
+    lows = [None] + boundaries
+    highs = boundaries + [None]
+    return [KeyRange(low, high) for low, high in zip(lows, highs)]
@@ -0,0 +1,42 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+
+class JsonFileStorage:
+    def __init__(self, file_path: str):
+        self.file_path = Path(file_path)
+
+    def save_state(self, state: dict):
+        tmp_path = self.file_path.with_suffix(f"{self.file_path.suffix}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(state, file, indent=2)
+        os.replace(tmp_path, self.file_path)
+
+    def retrieve_state(self) -> dict:
+        try:
+            with open(self.file_path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logging.error(f"Broken state file {self.file_path}: {e}")
+            return {}
+
+
+class State:
+    def __init__(self, storage: JsonFileStorage):
+        self.storage = storage
+        self.state = storage.retrieve_state()
+        self.lock = threading.Lock()
+
+    def set_state(self, key: str, value: Any):
+        with self.lock:
+            self.state[key] = value
+            self.storage.save_state(self.state)
+
+    def get_state(self, key: str, default: Any = None) -> Any:
+        return self.state.get(key, default)